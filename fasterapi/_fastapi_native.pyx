@@ -548,6 +548,36 @@ def extract_path_params(str pattern):
     return [p.decode('utf-8') for p in params]
 
 
+def extract_path_params_batch(patterns):
+    """
+    Extract path parameter names from several route patterns in one call.
+
+    Args:
+        patterns: Iterable of route patterns
+
+    Returns:
+        List with one list of parameter names per pattern, in order
+
+    Raises:
+        TypeError: If a pattern is not a str
+
+    Example:
+        >>> extract_path_params_batch(["/users/{user_id}", "/api/status"])
+        [["user_id"], []]
+    """
+    cdef str pattern
+    cdef vector[string] params
+    cdef list result = []
+    # Typed loop variable: non-str items raise TypeError on assignment;
+    # a typed str still admits None, so that is rejected explicitly
+    for pattern in patterns:
+        if pattern is None:
+            raise TypeError("pattern must be str, not None")
+        params = ParameterExtractor.extract_path_params(pattern.encode('utf-8'))
+        result.append([p.decode('utf-8') for p in params])
+    return result
+
+
 def parse_query_params(str url):
     """
     Parse query parameters from a URL.
@@ -0,0 +1,25 @@
+"""
+Typing helpers shared across FasterAPI modules.
+"""
+
+from functools import lru_cache
+from typing import Optional, Union
+
+# get_origin() returns typing.Union for Union[...]/Optional[T] and
+# types.UnionType for PEP 604 unions (int | None)
+try:
+    from types import UnionType
+
+    UNION_ORIGINS = frozenset((Union, UnionType))
+except ImportError:  # Python < 3.10
+    UNION_ORIGINS = frozenset((Union,))
+
+
+@lru_cache(maxsize=None)
+def pydantic_base_model() -> Optional[type]:
+    """Import Pydantic's BaseModel on first use (None if not installed)."""
+    try:
+        from pydantic import BaseModel
+    except ImportError:
+        return None
+    return BaseModel
@@ -12,7 +12,9 @@ T = TypeVar('T')
 U = TypeVar('U')
 
 
-async def when_all(futures: List[Future[T]]) -> List[T]:
+async def when_all(
+    futures: List[Future[T]], typecode: Optional[str] = None
+) -> List[T]:
     """
     Wait for all futures to complete.
     
@@ -20,6 +22,8 @@ async def when_all(futures: List[Future[T]]) -> List[T]:
     
     Args:
         futures: List of futures to wait for
+        typecode: Optional array module typecode ('q', 'd', ...) to collect
+            numeric results into an array.array
         
     Returns:
         List of results in same order
@@ -31,7 +35,7 @@ async def when_all(futures: List[Future[T]]) -> List[T]:
         ])
         users, products = results
     """
-    return await _when_all(futures)
+    return await _when_all(futures, typecode)
 
 
 async def when_any(futures: List[Future[T]]) -> tuple[T, List[Future[T]]]:
@@ -50,6 +54,18 @@ async def when_any(futures: List[Future[T]]) -> tuple[T, List[Future[T]]]:
             db.get_async(key),
         ])
     """
+    # A future that has already succeeded wins outright; no tasks needed.
+    # Other awaitables in the rest are started with ensure_future so
+    # coroutines still run (asyncio futures and tasks come back unchanged).
+    for i, f in enumerate(futures):
+        if isinstance(f, Future) and f._resolved:
+            remaining = [
+                g if isinstance(g, Future) else asyncio.ensure_future(g)
+                for j, g in enumerate(futures)
+                if j != i and not (isinstance(g, Future) and (g._resolved or g._failed))
+            ]
+            return f._value, remaining
+
     # Helper to properly await any awaitable
     async def _await(f):
         return await f
@@ -182,6 +198,11 @@ class Pipeline:
     
     def __init__(self):
         self.stages: List[Callable] = []
+        # Whether any stage is a coroutine function, valid while stages
+        # still holds exactly the _checked_stages objects (callers may also
+        # append to or replace entries in stages directly)
+        self._has_async = False
+        self._checked_stages: List[Callable] = []
     
     def add(self, func: Callable) -> 'Pipeline':
         """Add a stage to the pipeline."""
@@ -190,8 +211,20 @@ class Pipeline:
     
     async def execute(self, initial: Any = None) -> Any:
         """Execute the pipeline."""
+        stages = self.stages
+        # List equality compares the stage objects in C, identity first
+        if stages != self._checked_stages:
+            self._has_async = any(asyncio.iscoroutinefunction(s) for s in stages)
+            self._checked_stages = list(stages)
+
         result = initial
-        for stage in self.stages:
+        if not self._has_async:
+            # All stages are plain callables: run them back to back
+            for stage in stages:
+                result = stage(result) if result is not None else stage()
+            return result
+
+        for stage in stages:
             if asyncio.iscoroutinefunction(stage):
                 result = await stage(result) if result is not None else await stage()
             else:
@@ -232,6 +265,12 @@ async def retry_async(
     for attempt in range(max_retries + 1):
         try:
             future = func()
+            if isinstance(future, Future):
+                # Settled futures are read directly instead of awaited
+                if future._resolved:
+                    return future._value
+                if future._failed:
+                    raise future._exception or Exception("Future failed")
             return await future
         except Exception as e:
             last_exception = e
@@ -262,11 +301,11 @@ async def timeout_async(future: Future[T], timeout_seconds: float) -> T:
             timeout_seconds=5.0
         )
     """
-    # Helper to properly await any awaitable
-    async def _await():
-        return await future
+    # An already-resolved future can't time out; skip scheduling a timer
+    if isinstance(future, Future) and future._resolved:
+        return future._value
 
-    return await asyncio.wait_for(_await(), timeout=timeout_seconds)
+    return await asyncio.wait_for(future, timeout=timeout_seconds)
 
 
 def chain(*funcs: Callable) -> Callable:
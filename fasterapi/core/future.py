@@ -4,6 +4,7 @@ Python Future Wrapper
 Bridges C++ futures to Python's async/await syntax.
 """
 
+import array
 import asyncio
 from typing import TypeVar, Generic, Callable, List, Any, Optional
 from . import bindings as _bindings
@@ -25,6 +26,8 @@ class Future(Generic[T]):
         # Explicit chaining (power users)
         future.then(lambda x: process(x)).then(lambda y: respond(y))
     """
+
+    __slots__ = ("_handle", "_value", "_resolved", "_failed", "_exception")
     
     def __init__(self, handle: Optional[int] = None, value: Optional[T] = None):
         """
@@ -46,36 +49,34 @@ class Future(Generic[T]):
         
         Integrates with Python's asyncio event loop.
         """
-        # Create async generator function
-        async def _await_impl():
-            if self._resolved:
-                # Fast path: already resolved
-                return self._value
-            
-            if self._failed:
-                raise self._exception or Exception("Future failed")
-            
-            # Integrate with asyncio
-            loop = asyncio.get_event_loop()
-            py_future = loop.create_future()
-            
-            def callback(handle, success, value_ptr):
-                """C++ callback that resolves Python future."""
-                if success:
-                    py_future.set_result(value_ptr)
-                else:
-                    py_future.set_exception(Exception("Future failed"))
-            
-            # Register callback with C++ future
-            if self._handle:
-                _bindings.future_add_callback(self._handle, callback)
+        # A plain generator rather than a nested coroutine: awaiting no
+        # longer allocates a fresh closure and coroutine object per await
+        if self._resolved:
+            # Fast path: already resolved
+            return self._value
+        
+        if self._failed:
+            raise self._exception or Exception("Future failed")
+        
+        # Integrate with asyncio
+        loop = asyncio.get_event_loop()
+        py_future = loop.create_future()
+        
+        def callback(handle, success, value_ptr):
+            """C++ callback that resolves Python future."""
+            if success:
+                py_future.set_result(value_ptr)
             else:
-                # No C++ handle, resolve immediately with value
-                py_future.set_result(self._value)
-            
-            return await py_future
+                py_future.set_exception(Exception("Future failed"))
+        
+        # Register callback with C++ future
+        if self._handle:
+            _bindings.future_add_callback(self._handle, callback)
+        else:
+            # No C++ handle, resolve immediately with value
+            py_future.set_result(self._value)
         
-        return _await_impl().__await__()
+        return (yield from py_future)
     
     def then(self, func: Callable[[T], Any]) -> 'Future':
         """
@@ -102,11 +103,9 @@ class Future(Generic[T]):
                 return f
         
         if self._failed:
-            # Propagate failure
-            f = Future()
-            f._failed = True
-            f._exception = self._exception
-            return f
+            # Propagate failure: a failed future never changes, so every
+            # stage of a failed chain can share it
+            return self
         
         # Chain via C++
         if self._handle:
@@ -134,6 +133,9 @@ class Future(Generic[T]):
                 result = func(self._exception)
                 return Future(value=result)
             except Exception as e:
+                if e is self._exception:
+                    # Handler re-raised: this future already says so
+                    return self
                 f = Future()
                 f._failed = True
                 f._exception = e
@@ -197,15 +199,20 @@ class Future(Generic[T]):
         return f
 
 
-async def when_all(futures: List[Future[T]]) -> List[T]:
+async def when_all(
+    futures: List[Future[T]], typecode: Optional[str] = None
+) -> List[T]:
     """
     Wait for all futures to complete.
     
     Args:
         futures: List of futures to wait for
+        typecode: Optional array module typecode (e.g. 'q', 'd'); when given,
+            numeric results are collected into a preallocated array.array
+            instead of a list of boxed objects
         
     Returns:
-        List of results in same order
+        List of results in same order (array.array if typecode is given)
         
     Example:
         results = await when_all([
@@ -213,13 +220,30 @@ async def when_all(futures: List[Future[T]]) -> List[T]:
             pg.exec_async("SELECT ..."),
         ])
     """
-    # Create async tasks for each future
-    tasks = [asyncio.create_task(_await_future(f)) for f in futures]
-    return await asyncio.gather(*tasks)
+    # Copy already-resolved values straight into the result; only the
+    # rest need a task and a trip through the event loop
+    if typecode is None:
+        results: Any = [None] * len(futures)
+    else:
+        itemsize = array.array(typecode).itemsize
+        results = array.array(typecode, bytes(itemsize * len(futures)))
+    pending = []
+    for i, f in enumerate(futures):
+        if isinstance(f, Future) and f._resolved:
+            results[i] = f._value
+        else:
+            pending.append(_await_into(results, i, f))
+
+    if len(pending) == 1:
+        # A single awaitable needs no Task; await it inline
+        await pending[0]
+    elif pending:
+        await asyncio.gather(*pending)
+    return results
 
-async def _await_future(f: Future[T]) -> T:
-    """Helper to await a future."""
-    return await f
+async def _await_into(results: Any, index: int, f: Future[T]) -> None:
+    """Await a future and store its value at results[index]."""
+    results[index] = await f
 
 
 async def when_any(futures: List[Future[T]]) -> T:
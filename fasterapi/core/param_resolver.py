@@ -9,6 +9,8 @@ import os
 import json
 from typing import Callable, get_type_hints, get_origin, get_args, Any
 
+from fasterapi._typing import UNION_ORIGINS
+
 # Try to import Request class
 try:
     from fasterapi.http.request import Request
@@ -85,7 +87,7 @@ def coerce_value(value: str, target_type: type, param_name: str) -> tuple:
     # Handle Optional types
     origin = get_origin(target_type)
     if origin is not None:
-        if str(origin) in ("typing.Union", "types.UnionType"):
+        if origin in UNION_ORIGINS:
             args = get_args(target_type)
             # Get non-None types
             non_none_types = [t for t in args if t is not type(None)]
@@ -216,7 +218,7 @@ def resolve_params(handler: Callable, kwargs: dict) -> dict:
             else:
                 # Check if Optional type
                 origin = get_origin(param_type)
-                if str(origin) in ("typing.Union", "types.UnionType"):
+                if origin in UNION_ORIGINS:
                     args = get_args(param_type)
                     if type(None) in args:
                         resolved_kwargs[param_name] = None
@@ -18,6 +18,8 @@ import struct
 from typing import Dict, Callable, Any, get_type_hints, get_origin, get_args, List, Optional, Union
 from enum import Enum
 
+from fasterapi._typing import UNION_ORIGINS
+
 # Import Request class for type injection
 try:
     from fasterapi.http.request import Request
@@ -224,7 +226,7 @@ def coerce_value(value: Any, target_type: Any, param_name: str) -> tuple:
     # Handle Optional[T] - unwrap to T
     if origin is type(None):
         return None, None
-    if str(origin) in ("typing.Union", "types.UnionType"):
+    if origin in UNION_ORIGINS:
         args = get_args(target_type)
         if len(args) == 2 and type(None) in args:
             # Optional[T] - get the non-None type
@@ -693,7 +695,7 @@ class ZmqWorker:
                 else:
                     # Check if Optional type
                     origin = get_origin(param_type)
-                    if str(origin) in ("typing.Union", "types.UnionType"):
+                    if origin in UNION_ORIGINS:
                         args = get_args(param_type)
                         if type(None) in args:
                             resolved_kwargs[param_name] = None
@@ -6,30 +6,35 @@ while leveraging C++ for all performance-critical operations.
 """
 
 import inspect
+import json
+import re
+import sys
+import weakref
+from datetime import date, datetime
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
+from types import FunctionType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     List,
     Optional,
+    Tuple,
     Type,
+    TypedDict,
     Union,
     get_args,
     get_origin,
     get_type_hints,
 )
 
-try:
+if TYPE_CHECKING:
     from pydantic import BaseModel
-    from pydantic import ValidationError as PydanticValidationError
 
-    HAS_PYDANTIC = True
-except ImportError:
-    HAS_PYDANTIC = False
-    BaseModel = object
-    PydanticValidationError = Exception
+from fasterapi._typing import UNION_ORIGINS
+from fasterapi._typing import pydantic_base_model as _base_model
 
 # Import our exception classes
 from fasterapi.exceptions import (
@@ -58,7 +63,22 @@ except ImportError:
     print("Warning: FasterAPI native bindings not available. Using fallback mode.")
 
 
-# Type mapping from Python to schema type strings
+# Bumped on every native route registration, whichever app, router or
+# module-level decorator makes it; cached OpenAPI documents are tagged with
+# the value they were generated at
+_route_registry_version = 0
+
+
+def _register_native_route(*args: Any, **kwargs: Any) -> int:
+    """Register a route with the C++ RouteRegistry and bump the version."""
+    global _route_registry_version
+    _route_registry_version += 1
+    return register_route(*args, **kwargs)
+
+
+# Type mapping from Python to schema type strings. Identifier-like literals
+# are interned at compile time, so these values, the location names and the
+# literals compared against them elsewhere are the same objects.
 PYTHON_TYPE_MAP = {
     str: "string",
     int: "integer",
@@ -70,6 +90,114 @@ PYTHON_TYPE_MAP = {
 }
 
 
+class _PydanticUnavailableError(Exception):
+    """Stand-in for pydantic.ValidationError when Pydantic is not installed."""
+
+
+@lru_cache(maxsize=None)
+def _pydantic_validation_error() -> Type[Exception]:
+    """Import Pydantic's ValidationError on first use."""
+    try:
+        from pydantic import ValidationError
+    except ImportError:
+        return _PydanticUnavailableError
+    return ValidationError
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the Pydantic aliases this module used to define at import.
+
+    HAS_PYDANTIC, BaseModel and PydanticValidationError are looked up on
+    first access, so importing fastapi_compat still doesn't import pydantic.
+    """
+    if name == "HAS_PYDANTIC":
+        return _base_model() is not None
+    if name == "BaseModel":
+        return _base_model() or object
+    if name == "PydanticValidationError":
+        if _base_model() is None:
+            return Exception
+        return _pydantic_validation_error()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# {name} placeholders in route path patterns
+_PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
+_NO_PATH_PARAMS: frozenset = frozenset()
+
+
+@lru_cache(maxsize=1024)
+def _path_param_names(path_pattern: str) -> frozenset:
+    """Names of the {param} placeholders in a path pattern (cached per path)."""
+    if "{" not in path_pattern:
+        return _NO_PATH_PARAMS
+    return frozenset(_PATH_PARAM_RE.findall(path_pattern))
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the non-JSON types handlers commonly return."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_json(body: Any) -> bytes:
+    """
+    Serialize a response body to JSON bytes.
+
+    Always the standard library encoder: orjson differs in whitespace,
+    NaN, float and key formatting and in the types it accepts, so using it
+    when installed would make the response bytes depend on the environment.
+    """
+    return json.dumps(body, default=_json_default).encode()
+
+
+def _v2_model_fields(model: type) -> Dict[str, Any]:
+    return model.model_fields
+
+
+def _v2_field_annotation(field: Any) -> Any:
+    return field.annotation
+
+
+def _v2_field_required(field: Any) -> bool:
+    return field.is_required()
+
+
+def _v1_model_fields(model: type) -> Dict[str, Any]:
+    return model.__fields__
+
+
+def _v1_field_annotation(field: Any) -> Any:
+    return field.outer_type_
+
+
+def _v1_field_required(field: Any) -> bool:
+    return bool(field.required)
+
+
+@lru_cache(maxsize=None)
+def _model_field_api() -> tuple:
+    """
+    Resolve the Pydantic field accessors for the installed major version.
+
+    Returns:
+        Tuple of (model_fields, field_annotation, field_required) callables
+    """
+    if hasattr(_base_model(), "model_fields"):
+        return _v2_model_fields, _v2_field_annotation, _v2_field_required
+    return _v1_model_fields, _v1_field_annotation, _v1_field_required
+
+
+def _is_pydantic_model(type_hint: Any) -> bool:
+    """Check whether a type hint is a Pydantic model class."""
+    if not isinstance(type_hint, type):
+        return False
+    base_model = _base_model()
+    return base_model is not None and issubclass(type_hint, base_model)
+
+
 def coerce_query_value(
     value: Union[str, List[str]],
     target_type: Any,
@@ -109,7 +237,7 @@ def coerce_query_value(
     # Handle Optional[T] - unwrap to T
     if origin is type(None):
         return None, None
-    if str(origin) in ("typing.Union", "types.UnionType"):
+    if origin in UNION_ORIGINS:
         args = get_args(target_type)
         if len(args) == 2 and type(None) in args:
             # Optional[T] - get the non-None type
@@ -154,7 +282,7 @@ def python_type_to_string(type_hint: Any) -> str:
         return "null"
 
     # Handle Union types (including Optional)
-    if origin is type(type_hint) or str(origin) in ("typing.Union", "types.UnionType"):
+    if origin in UNION_ORIGINS:
         args = get_args(type_hint)
         if len(args) == 2 and type(None) in args:
             # This is Optional[T]
@@ -168,15 +296,12 @@ def python_type_to_string(type_hint: Any) -> str:
         return "object"
 
     # Handle basic types
-    if type_hint in PYTHON_TYPE_MAP:
-        return PYTHON_TYPE_MAP[type_hint]
+    type_str = PYTHON_TYPE_MAP.get(type_hint)
+    if type_str is not None:
+        return type_str
 
     # Handle Pydantic models
-    if (
-        HAS_PYDANTIC
-        and isinstance(type_hint, type)
-        and issubclass(type_hint, BaseModel)
-    ):
+    if _is_pydantic_model(type_hint):
         return "object"
 
     # Default to any
@@ -184,7 +309,7 @@ def python_type_to_string(type_hint: Any) -> str:
 
 
 def extract_pydantic_schema(
-    model: Type[BaseModel], schema_name: Optional[str] = None
+    model: Type["BaseModel"], schema_name: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Extract schema definition from a Pydantic model.
@@ -196,20 +321,30 @@ def extract_pydantic_schema(
     Returns:
         Schema dictionary compatible with C++ SchemaValidator
     """
-    if (
-        not HAS_PYDANTIC
-        or not isinstance(model, type)
-        or not issubclass(model, BaseModel)
-    ):
+    if not _is_pydantic_model(model):
         return {"name": schema_name or "Unknown", "fields": []}
 
     name = schema_name or model.__name__
+    fields = [dict(field) for field in _pydantic_schema_fields(model)]
+
+    return {"name": name, "fields": fields}
+
+
+@lru_cache(maxsize=512)
+def _pydantic_schema_fields(model: Type["BaseModel"]) -> tuple:
+    """
+    Build the schema field definitions of a Pydantic model.
+
+    Model classes don't change once defined, so type strings and default
+    strings are computed once per model and reused on later extractions.
+    """
+    model_fields, field_annotation, field_required = _model_field_api()
     fields = []
 
     # Extract fields from Pydantic model
-    for field_name, field_info in model.model_fields.items():
-        field_type = field_info.annotation
-        is_required = field_info.is_required()
+    for field_name, field_info in model_fields(model).items():
+        field_type = field_annotation(field_info)
+        is_required = field_required(field_info)
 
         fields.append(
             {
@@ -222,12 +357,36 @@ def extract_pydantic_schema(
             }
         )
 
-    return {"name": name, "fields": fields}
+    return tuple(fields)
+
+
+class ParameterInfo(TypedDict):
+    """Parameter definition as handed to the C++ route registry."""
+
+    name: str
+    type: str
+    location: str  # "path", "query" or "body"
+    required: bool
+    default: str
+    description: str
+
+
+def _coerce_response(model: Type["BaseModel"], data: Any, validate: bool = True):
+    """
+    Build a response_model instance from handler output.
+
+    With ``validate=False`` the handler's dicts are trusted and go through
+    model_construct(), skipping field validation; anything else is still
+    validated.
+    """
+    if not validate and isinstance(data, dict):
+        return model.model_construct(**data)
+    return model.model_validate(data)
 
 
 def extract_function_parameters(
     func: Callable, path_pattern: str, method: str
-) -> List[Dict[str, Any]]:
+) -> List[ParameterInfo]:
     """
     Extract parameter definitions from function signature.
 
@@ -239,57 +398,178 @@ def extract_function_parameters(
     Returns:
         List of parameter definitions
     """
-    sig = inspect.signature(func)
-    type_hints = get_type_hints(func)
-    parameters = []
+    return list(
+        extract_function_parameters_by_name(func, path_pattern, method).values()
+    )
 
-    # Extract path parameters from pattern
-    import re
 
-    path_params = set(re.findall(r"\{(\w+)\}", path_pattern))
+def extract_function_parameters_by_name(
+    func: Callable, path_pattern: str, method: str
+) -> Dict[str, ParameterInfo]:
+    """
+    Extract parameter definitions keyed by parameter name.
+
+    Same definitions as extract_function_parameters(), in signature order,
+    for callers that need to look parameters up by name.
 
-    for param_name, param in sig.parameters.items():
-        # Get type hint
+    Args:
+        func: The handler function
+        path_pattern: URL path pattern (e.g., '/users/{user_id}')
+        method: HTTP method
+
+    Returns:
+        Dict of parameter name -> parameter definition
+    """
+    if (
+        _is_plain_function(func)
+        and not func.__code__.co_argcount
+        and not func.__code__.co_kwonlyargcount
+    ):
+        # Parameterless handler (/health, /metrics, ...): nothing to extract
+        return {}
+
+    try:
+        by_route = _PARAMETER_CACHE.get(func)
+    except TypeError:
+        # Not weak-referenceable; introspect every time
+        return _extract_parameters(func, path_pattern)
+
+    key = (path_pattern, method)
+    if by_route is None:
+        by_route = _PARAMETER_CACHE[func] = {}
+    parameters = by_route.get(key)
+    if parameters is None:
+        parameters = by_route[key] = _extract_parameters(func, path_pattern)
+
+    # Hand out copies so callers can't corrupt the cached definitions
+    return {name: dict(param) for name, param in parameters.items()}
+
+
+# handler -> {(path_pattern, method): parameter definitions}. Weakly keyed
+# so handlers built at runtime (closures, exec) are not kept alive.
+_PARAMETER_CACHE: "weakref.WeakKeyDictionary[Callable, Dict[Any, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _extract_parameters(
+    func: Callable, path_pattern: str
+) -> Dict[str, ParameterInfo]:
+    """Uncached body of extract_function_parameters_by_name()."""
+    type_hints = _type_hints(func)
+    parameters = {}
+
+    # Extract path parameters from pattern
+    path_params = _path_param_names(path_pattern)
+
+    for param_name, default in _signature_defaults(func):
+        # Get type hint; builtin scalars (the bulk of path and query
+        # parameters) map directly and can never be a body model
         param_type = type_hints.get(param_name, Any)
-        type_str = python_type_to_string(param_type)
+        type_str = PYTHON_TYPE_MAP.get(param_type)
+        if type_str is None:
+            is_model = _is_pydantic_model(param_type)
+            type_str = "object" if is_model else python_type_to_string(param_type)
+        else:
+            is_model = False
 
         # Determine parameter location
         if param_name in path_params:
             location = "path"
             required = True
-        elif (
-            HAS_PYDANTIC
-            and isinstance(param_type, type)
-            and issubclass(param_type, BaseModel)
-        ):
+        elif is_model:
             # Pydantic model in body
             location = "body"
             required = True
         else:
             # Query parameter
             location = "query"
-            required = param.default == inspect.Parameter.empty
+            required = default is _EMPTY
 
         # Get default value
-        default_value = (
-            "" if param.default == inspect.Parameter.empty else str(param.default)
-        )
-
-        parameters.append(
-            {
-                "name": param_name,
-                "type": type_str,
-                "location": location,
-                "required": required,
-                "default": default_value,
-                "description": "",
-            }
-        )
+        default_value = "" if default is _EMPTY else str(default)
+
+        parameters[param_name] = {
+            "name": param_name,
+            "type": type_str,
+            "location": location,
+            "required": required,
+            "default": default_value,
+            "description": "",
+        }
 
     return parameters
 
 
-def register_pydantic_schema(model: Type[BaseModel]) -> str:
+def _type_hints(func: Callable) -> Dict[str, Any]:
+    """
+    get_type_hints() for a handler, skipping it when it would be a no-op.
+
+    When every parameter annotation is already a plain class (``int``,
+    ``str``, a model) there are no strings to evaluate and nothing to
+    unwrap, so ``__annotations__`` is returned as-is. Forward references,
+    typing generics and Annotated still go through get_type_hints().
+    """
+    annotations = getattr(func, "__annotations__", None)
+    if annotations is None:
+        return get_type_hints(func)
+    for name, hint in annotations.items():
+        if name != "return" and not isinstance(hint, type):
+            return get_type_hints(func)
+    return annotations
+
+
+_EMPTY = inspect.Parameter.empty
+_CO_VARARGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+def _is_plain_function(func: Callable) -> bool:
+    """True if func's signature can be read straight off its code object."""
+    return (
+        type(func) is FunctionType
+        and not func.__code__.co_flags & _CO_VARARGS
+        and "__wrapped__" not in func.__dict__
+        and "__signature__" not in func.__dict__
+    )
+
+
+def _signature_defaults(func: Callable) -> List[tuple]:
+    """
+    (name, default) pairs for a handler's parameters, in signature order.
+
+    Plain functions are read straight off ``__code__``/``__defaults__``,
+    which avoids building a Signature. Anything else (wrapped functions,
+    partials, callables, ``*args``/``**kwargs``, an explicit
+    ``__signature__``) goes through
+    inspect.signature(). Missing defaults are ``inspect.Parameter.empty``.
+    """
+    if not _is_plain_function(func):
+        return [
+            (name, param.default)
+            for name, param in inspect.signature(func).parameters.items()
+        ]
+
+    code = func.__code__
+    argcount = code.co_argcount
+    kwonlycount = code.co_kwonlyargcount
+    names = code.co_varnames[: argcount + kwonlycount]
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+
+    first_default = argcount - len(defaults)
+    result = []
+    for index, name in enumerate(names):
+        if index >= argcount:
+            default = kwdefaults.get(name, _EMPTY)
+        elif index >= first_default:
+            default = defaults[index - first_default]
+        else:
+            default = _EMPTY
+        result.append((name, default))
+    return result
+
+
+def register_pydantic_schema(model: Type["BaseModel"]) -> str:
     """
     Register a Pydantic model schema with C++ SchemaRegistry.
 
@@ -299,7 +579,7 @@ def register_pydantic_schema(model: Type[BaseModel]) -> str:
     Returns:
         Schema name
     """
-    if not HAS_NATIVE or not HAS_PYDANTIC:
+    if not HAS_NATIVE or _base_model() is None:
         return ""
 
     schema_name = model.__name__
@@ -318,7 +598,7 @@ def register_pydantic_schema(model: Type[BaseModel]) -> str:
 def route_decorator(
     method: str,
     path: str,
-    response_model: Optional[Type[BaseModel]] = None,
+    response_model: Optional[Type["BaseModel"]] = None,
     summary: str = "",
     description: str = "",
     tags: Optional[List[str]] = None,
@@ -350,64 +630,64 @@ def route_decorator(
             return func
 
         # Extract function signature
-        parameters = extract_function_parameters(func, path, method)
+        params_by_name = extract_function_parameters_by_name(func, path, method)
+        parameters = list(params_by_name.values())
 
         # Find request body schema (Pydantic model parameter)
         request_body_schema = ""
-        type_hints = get_type_hints(func)
+        type_hints = _type_hints(func)
 
-        # Build map of Pydantic model parameters for wrapper
-        pydantic_params: Dict[str, Type[BaseModel]] = {}
-        for param_name, param_type in type_hints.items():
-            if param_name == "return":
+        # Build map of Pydantic model parameters for wrapper; body params
+        # were already classified during extraction
+        pydantic_params: Dict[str, Type["BaseModel"]] = {}
+        for param_name, param_def in params_by_name.items():
+            if param_def["location"] != "body":
                 continue
-            if (
-                HAS_PYDANTIC
-                and isinstance(param_type, type)
-                and issubclass(param_type, BaseModel)
-            ):
-                pydantic_params[param_name] = param_type
-                if not request_body_schema:
-                    request_body_schema = register_pydantic_schema(param_type)
+            param_type = type_hints[param_name]
+            pydantic_params[param_name] = param_type
+            if not request_body_schema:
+                request_body_schema = register_pydantic_schema(param_type)
 
         # Register response schema if provided
         response_schema = ""
-        if response_model and HAS_PYDANTIC:
+        if response_model and _base_model() is not None:
             response_schema = register_pydantic_schema(response_model)
 
-        # Create wrapper that validates Pydantic models and handles exceptions
+        # Every route is registered through this wrapper: the C++
+        # ExceptionHandlerRegistry stringifies a non-string HTTPException
+        # detail, so HTTPException and unexpected errors are turned into
+        # JSON (body, status) tuples here
         @wraps(func)
         def wrapper(*args, **kw):
             try:
                 # Convert dict kwargs to Pydantic model instances
-                if pydantic_params:
-                    for param_name, model_class in pydantic_params.items():
-                        if param_name in kw and isinstance(kw[param_name], dict):
-                            try:
-                                kw[param_name] = model_class.model_validate(
-                                    kw[param_name]
-                                )
-                            except PydanticValidationError as e:
-                                # Return 422 validation error in FastAPI format
-                                errors = convert_pydantic_validation_error(
-                                    e, loc_prefix=("body",)
-                                )
-                                return (format_validation_error_response(errors), 422)
-                            except Exception as e:
-                                # Generic validation error
-                                return (
-                                    {
-                                        "detail": [
-                                            {
-                                                "type": "value_error",
-                                                "loc": ["body", param_name],
-                                                "msg": str(e),
-                                                "input": kw.get(param_name),
-                                            }
-                                        ]
-                                    },
-                                    422,
-                                )
+                for param_name, model_class in pydantic_params.items():
+                    if param_name in kw and isinstance(kw[param_name], dict):
+                        try:
+                            kw[param_name] = model_class.model_validate(
+                                kw[param_name]
+                            )
+                        except _pydantic_validation_error() as e:
+                            # Return 422 validation error in FastAPI format
+                            errors = convert_pydantic_validation_error(
+                                e, loc_prefix=("body",)
+                            )
+                            return (format_validation_error_response(errors), 422)
+                        except Exception as e:
+                            # Generic validation error
+                            return (
+                                {
+                                    "detail": [
+                                        {
+                                            "type": "value_error",
+                                            "loc": ["body", param_name],
+                                            "msg": str(e),
+                                            "input": kw.get(param_name),
+                                        }
+                                    ]
+                                },
+                                422,
+                            )
 
                 # Call the actual handler
                 return func(*args, **kw)
@@ -426,24 +706,20 @@ def route_decorator(
                 # Unexpected error - return 500
                 return ({"detail": f"Internal server error: {str(e)}"}, 500)
 
-        handler_to_register = wrapper
-
         # Register route with C++ RouteRegistry
         # Convert openapi_extra dict to JSON string fragment (without braces)
         openapi_extra_str = ""
         if openapi_extra:
-            import json
-
             # Convert dict to JSON key-value pairs without outer braces
             pairs = []
             for k, v in openapi_extra.items():
                 pairs.append(f'"{k}":{json.dumps(v)}')
             openapi_extra_str = ",".join(pairs)
 
-        route_id = register_route(
+        route_id = _register_native_route(
             method=method.upper(),
             path_pattern=path,
-            handler=handler_to_register,
+            handler=wrapper,
             parameters=parameters,
             request_body_schema=request_body_schema,
             response_schema=response_schema,
@@ -465,6 +741,87 @@ def route_decorator(
     return decorator
 
 
+def _passthrough_route(method: str, path: str, *args, **kwargs):
+    """Route binder for fallback mode: the handler is returned unchanged."""
+    return _identity_decorator
+
+
+def _identity_decorator(func: Callable) -> Callable:
+    return func
+
+
+class _Route:
+    """
+    Handler metadata for the ASGI fallback router.
+
+    The signature and path matcher of a route never change, so requests
+    read them from here instead of re-introspecting the handler and
+    rebuilding the path regex on every call. The path regex is compiled at
+    registration; handler introspection is deferred to the first request
+    so registering a large app stays cheap.
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "handler",
+        "response_model",
+        "model_options",
+        "path_regex",
+        "path_param_names",
+        "_signature",
+        "_type_hints",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        handler: Callable,
+        response_model: Optional[Any] = None,
+        model_options: Optional[Dict[str, bool]] = None,
+    ):
+        self.method = method
+        self.path = path
+        self.handler = handler
+        self.response_model = response_model
+        self.model_options = model_options if model_options is not None else {}
+        if "{" in path:
+            pattern = _PATH_PARAM_RE.sub(r"(?P<\1>[^/]+)", path)
+            self.path_regex = re.compile(f"^{pattern}$")
+            # Interned like the handler's own parameter names, so binding
+            # path params as keyword arguments matches keys by identity
+            self.path_param_names = tuple(
+                sys.intern(name) for name in _PATH_PARAM_RE.findall(path)
+            )
+        else:
+            self.path_regex = None
+            self.path_param_names = ()
+        self._signature: Optional[inspect.Signature] = None
+        self._type_hints: Optional[Dict[str, Any]] = None
+
+    @property
+    def signature(self) -> inspect.Signature:
+        """Handler signature, introspected on first use."""
+        sig = self._signature
+        if sig is None:
+            sig = self._signature = inspect.signature(self.handler)
+        return sig
+
+    @property
+    def type_hints(self) -> Dict[str, Any]:
+        """Handler type hints, resolved on first use (forward refs may not
+        be defined yet when the decorator runs)."""
+        hints = self._type_hints
+        if hints is None:
+            try:
+                hints = get_type_hints(self.handler)
+            except Exception:
+                return {}
+            self._type_hints = hints
+        return hints
+
+
 class FastAPIApp:
     """
     FastAPI-compatible application class.
@@ -474,6 +831,10 @@ class FastAPIApp:
     for running with uvicorn in fallback mode.
     """
 
+    # No __slots__: applications attach their own attributes (e.g.
+    # app.openapi = custom_openapi), which needs a per-instance __dict__
+    # anyway, and there is only one app per process.
+
     def __init__(
         self,
         title: str = "FasterAPI",
@@ -517,6 +878,11 @@ class FastAPIApp:
         self.redoc_url = redoc_url
         self.openapi_url = openapi_url
 
+        # Resolve native vs. fallback route binding once per app instead of
+        # checking the module flag on every decorator call
+        self._use_native = HAS_NATIVE
+        self._route = route_decorator if HAS_NATIVE else _passthrough_route
+
         # Lifespan context manager (new API)
         self._lifespan = lifespan
         self._lifespan_context = None  # Will hold the context manager instance
@@ -538,7 +904,7 @@ class FastAPIApp:
         self._middleware_app: Optional[Any] = None  # Cached middleware-wrapped app
 
         # Route storage for ASGI fallback mode
-        self._routes: Dict[str, Dict[str, Callable]] = {}  # {path: {method: handler}}
+        self._routes: Dict[str, Dict[str, _Route]] = {}  # {path: {method: route}}
         self._websocket_routes: Dict[str, Callable] = {}
 
         # Named routes for url_path_for() lookups: {name: path}
@@ -550,8 +916,12 @@ class FastAPIApp:
         # Mounted sub-applications {path_prefix: app}
         self._mounted_apps: Dict[str, Any] = {}
 
+        # (registry version, OpenAPI document), generated on first request
+        # to openapi_url and again once any route has been registered since
+        self._openapi_cache: Optional[Tuple[int, str]] = None
+
         # Register special routes if enabled
-        if HAS_NATIVE:
+        if self._use_native:
             if openapi_url:
                 self._register_openapi_route()
             if docs_url:
@@ -579,7 +949,6 @@ class FastAPIApp:
     async def _handle_http(self, scope, receive, send):
         """Handle HTTP request (called by middleware or directly)."""
         import json as json_module
-        import re
 
         path = scope["path"]
         method = scope["method"]
@@ -598,46 +967,36 @@ class FastAPIApp:
                 return
 
         # Find matching route
-        handler = None
-        response_model = None
-        model_options = {}  # Default empty options
+        route = None
         path_params = {}
 
         for route_path, methods in self._routes.items():
-            if method in methods:
-                # Check for exact match
-                if route_path == path:
-                    route_info = methods[method]
-                    if isinstance(route_info, tuple):
-                        if len(route_info) == 3:
-                            handler, response_model, model_options = route_info
-                        else:
-                            handler, response_model = route_info
-                    else:
-                        handler = route_info
-                    break
+            candidate = methods.get(method)
+            if candidate is None:
+                continue
+
+            # Check for exact match
+            if route_path == path:
+                route = candidate
+                break
 
-                # Check for path parameter match
-                pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", route_path)
-                pattern = f"^{pattern}$"
-                match = re.match(pattern, path)
+            # Check for path parameter match
+            if candidate.path_regex is not None:
+                match = candidate.path_regex.match(path)
                 if match:
-                    route_info = methods[method]
-                    if isinstance(route_info, tuple):
-                        if len(route_info) == 3:
-                            handler, response_model, model_options = route_info
-                        else:
-                            handler, response_model = route_info
-                    else:
-                        handler = route_info
-                    path_params = match.groupdict()
+                    route = candidate
+                    path_params = dict(zip(candidate.path_param_names, match.groups()))
                     break
 
-        if handler is None:
+        if route is None:
             # 404 Not Found
             await self._send_json_response(send, {"detail": "Not Found"}, 404)
             return
 
+        handler = route.handler
+        response_model = route.response_model
+        model_options = route.model_options
+
         # Parse request body
         body = b""
         while True:
@@ -688,12 +1047,8 @@ class FastAPIApp:
                 form_data = await temp_request.form()
 
         # Build kwargs for handler based on signature
-        kwargs = {}
-        sig = inspect.signature(handler)
-        try:
-            type_hints = get_type_hints(handler)
-        except Exception:
-            type_hints = {}
+        sig = route.signature
+        type_hints = route.type_hints
 
         # Import param classes and UploadFile to check instance
         try:
@@ -844,11 +1199,7 @@ class FastAPIApp:
                     continue
 
             # Check if it's a Pydantic model (body parameter)
-            if (
-                HAS_PYDANTIC
-                and isinstance(param_type, type)
-                and issubclass(param_type, BaseModel)
-            ):
+            if _is_pydantic_model(param_type):
                 if body_data is not None:
                     try:
                         # Convert dict to Pydantic model instance
@@ -951,7 +1302,8 @@ class FastAPIApp:
                     result, status_code, headers = result[0], result[1], result[2]
 
             # Apply response_model validation/filtering if specified
-            if response_model is not None and HAS_PYDANTIC:
+            BaseModel = _base_model()
+            if response_model is not None and BaseModel is not None:
                 try:
                     # Build model_dump kwargs from model_options
                     model_dump_kwargs = {}
@@ -970,33 +1322,32 @@ class FastAPIApp:
 
                     if origin is list:
                         args = get_args(response_model)
-                        if (
-                            args
-                            and isinstance(args[0], type)
-                            and issubclass(args[0], BaseModel)
-                        ):
+                        if args and _is_pydantic_model(args[0]):
                             inner_model = args[0]
 
+                    validate = model_options.get("validate", True)
+
                     if isinstance(result, list) and inner_model is not None:
                         # Handle List[ResponseModel]
                         validated = []
                         for item in result:
-                            if isinstance(item, BaseModel):
+                            if isinstance(item, inner_model):
+                                # Already the correct type - dump directly with options
+                                validated.append(item.model_dump(**model_dump_kwargs))
+                            elif isinstance(item, BaseModel):
                                 # Convert to dict first, then validate through response model
                                 item_dict = item.model_dump()
                                 validated.append(
-                                    inner_model.model_validate(item_dict).model_dump(**model_dump_kwargs)
+                                    _coerce_response(inner_model, item_dict, validate).model_dump(**model_dump_kwargs)
                                 )
                             elif isinstance(item, dict):
                                 validated.append(
-                                    inner_model.model_validate(item).model_dump(**model_dump_kwargs)
+                                    _coerce_response(inner_model, item, validate).model_dump(**model_dump_kwargs)
                                 )
                             else:
                                 validated.append(item)
                         result = validated
-                    elif isinstance(response_model, type) and issubclass(
-                        response_model, BaseModel
-                    ):
+                    elif _is_pydantic_model(response_model):
                         # Validate and filter through response_model
                         # This handles both BaseModel instances and dicts
                         if isinstance(result, BaseModel):
@@ -1009,12 +1360,12 @@ class FastAPIApp:
                             else:
                                 # Different model type - need to convert through response_model
                                 result_dict = result.model_dump()
-                                result = response_model.model_validate(result_dict).model_dump(**model_dump_kwargs)
+                                result = _coerce_response(response_model, result_dict, validate).model_dump(**model_dump_kwargs)
                         elif isinstance(result, dict):
-                            result = response_model.model_validate(result).model_dump(**model_dump_kwargs)
+                            result = _coerce_response(response_model, result, validate).model_dump(**model_dump_kwargs)
                         else:
                             result = response_model.model_validate(result).model_dump(**model_dump_kwargs)
-                except PydanticValidationError as e:
+                except _pydantic_validation_error() as e:
                     # Response validation failed
                     errors = convert_pydantic_validation_error(
                         e, loc_prefix=("response",)
@@ -1023,7 +1374,7 @@ class FastAPIApp:
                         send, format_validation_error_response(errors), 500
                     )
                     return
-            elif HAS_PYDANTIC and isinstance(result, BaseModel):
+            elif BaseModel is not None and isinstance(result, BaseModel):
                 # Convert Pydantic models to dict even without response_model
                 result = result.model_dump()
 
@@ -1362,26 +1713,10 @@ class FastAPIApp:
 
     async def _send_json_response(self, send, body, status_code=200, headers=None):
         """Send a JSON response."""
-        import json as json_module
-        from datetime import date, datetime
-
         if headers is None:
             headers = {}
 
-        def json_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            elif isinstance(obj, date):
-                return obj.isoformat()
-            raise TypeError(
-                f"Object of type {type(obj).__name__} is not JSON serializable"
-            )
-
-        body_bytes = (
-            json_module.dumps(body, default=json_serializer).encode()
-            if body is not None
-            else b""
-        )
+        body_bytes = _dumps_json(body) if body is not None else b""
 
         response_headers = [
             (b"content-type", b"application/json"),
@@ -1557,7 +1892,17 @@ class FastAPIApp:
 
         @self.get(self.openapi_url)
         def openapi():
-            return generate_openapi(self.title, self.version, self.description)
+            return self._get_openapi_json()
+
+    def _get_openapi_json(self) -> str:
+        """Return the OpenAPI document, regenerated only after new routes."""
+        cache = self._openapi_cache
+        if cache is None or cache[0] != _route_registry_version:
+            cache = self._openapi_cache = (
+                _route_registry_version,
+                generate_openapi(self.title, self.version, self.description),
+            )
+        return cache[1]
 
     def _register_docs_route(self):
         """Register Swagger UI endpoint."""
@@ -1621,7 +1966,7 @@ class FastAPIApp:
         self,
         method: str,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1634,6 +1979,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """Internal method to register a route and return decorator."""
@@ -1645,44 +1991,44 @@ class FastAPIApp:
             "exclude_defaults": response_model_exclude_defaults,
             "exclude_none": response_model_exclude_none,
             "by_alias": response_model_by_alias,
+            "validate": response_model_validate,
         }
 
+        # Native registration (or passthrough in fallback mode), bound once
+        bind_route = self._route(
+            method,
+            path,
+            response_model,
+            summary,
+            description,
+            tags,
+            responses=responses,
+            operation_id=operation_id,
+            deprecated=deprecated,
+            openapi_extra=openapi_extra,
+            **kwargs,
+        )
+
         def decorator(func: Callable) -> Callable:
             # Store route for ASGI fallback mode (handler, response_model, model_options)
             if path not in app._routes:
                 app._routes[path] = {}
-            app._routes[path][method.upper()] = (func, response_model, model_options)
+            app._routes[path][method.upper()] = _Route(
+                method.upper(), path, func, response_model, model_options
+            )
 
             # Store named route for url_path_for() lookups
             final_name = route_name or func.__name__
             app._named_routes[final_name] = path
 
-            # If native bindings available, also register with C++
-            if HAS_NATIVE:
-                # Use the existing route_decorator logic
-                native_decorator = route_decorator(
-                    method,
-                    path,
-                    response_model,
-                    summary,
-                    description,
-                    tags,
-                    responses=responses,
-                    operation_id=operation_id,
-                    deprecated=deprecated,
-                    openapi_extra=openapi_extra,
-                    **kwargs,
-                )
-                return native_decorator(func)
-
-            return func
+            return bind_route(func)
 
         return decorator
 
     def get(
         self,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1695,6 +2041,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """GET route decorator."""
@@ -1714,13 +2061,14 @@ class FastAPIApp:
             response_model_exclude_defaults=response_model_exclude_defaults,
             response_model_exclude_none=response_model_exclude_none,
             response_model_by_alias=response_model_by_alias,
+            response_model_validate=response_model_validate,
             **kwargs,
         )
 
     def post(
         self,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1733,6 +2081,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """POST route decorator."""
@@ -1752,13 +2101,14 @@ class FastAPIApp:
             response_model_exclude_defaults=response_model_exclude_defaults,
             response_model_exclude_none=response_model_exclude_none,
             response_model_by_alias=response_model_by_alias,
+            response_model_validate=response_model_validate,
             **kwargs,
         )
 
     def put(
         self,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1771,6 +2121,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """PUT route decorator."""
@@ -1790,13 +2141,14 @@ class FastAPIApp:
             response_model_exclude_defaults=response_model_exclude_defaults,
             response_model_exclude_none=response_model_exclude_none,
             response_model_by_alias=response_model_by_alias,
+            response_model_validate=response_model_validate,
             **kwargs,
         )
 
     def delete(
         self,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1809,6 +2161,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """DELETE route decorator."""
@@ -1828,13 +2181,14 @@ class FastAPIApp:
             response_model_exclude_defaults=response_model_exclude_defaults,
             response_model_exclude_none=response_model_exclude_none,
             response_model_by_alias=response_model_by_alias,
+            response_model_validate=response_model_validate,
             **kwargs,
         )
 
     def patch(
         self,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1847,6 +2201,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """PATCH route decorator."""
@@ -1866,13 +2221,14 @@ class FastAPIApp:
             response_model_exclude_defaults=response_model_exclude_defaults,
             response_model_exclude_none=response_model_exclude_none,
             response_model_by_alias=response_model_by_alias,
+            response_model_validate=response_model_validate,
             **kwargs,
         )
 
     def options(
         self,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1884,6 +2240,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """OPTIONS route decorator."""
@@ -1902,13 +2259,14 @@ class FastAPIApp:
             response_model_exclude_defaults=response_model_exclude_defaults,
             response_model_exclude_none=response_model_exclude_none,
             response_model_by_alias=response_model_by_alias,
+            response_model_validate=response_model_validate,
             **kwargs,
         )
 
     def head(
         self,
         path: str,
-        response_model: Optional[Type[BaseModel]] = None,
+        response_model: Optional[Type["BaseModel"]] = None,
         summary: str = "",
         description: str = "",
         tags: Optional[List[str]] = None,
@@ -1920,6 +2278,7 @@ class FastAPIApp:
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         response_model_by_alias: bool = False,
+        response_model_validate: bool = True,
         **kwargs,
     ):
         """HEAD route decorator."""
@@ -1938,6 +2297,7 @@ class FastAPIApp:
             response_model_exclude_defaults=response_model_exclude_defaults,
             response_model_exclude_none=response_model_exclude_none,
             response_model_by_alias=response_model_by_alias,
+            response_model_validate=response_model_validate,
             **kwargs,
         )
 
@@ -1972,7 +2332,7 @@ class FastAPIApp:
             self._websocket_routes[path] = func
 
             # Register with native if available
-            if HAS_NATIVE:
+            if self._use_native:
                 import json as _json
                 import inspect
                 # Get module and function names for ZMQ worker handler lookup
@@ -1989,7 +2349,7 @@ class FastAPIApp:
                         pass
                 # Store handler metadata in openapi_extra for ZMQ worker to import handler
                 ws_metadata = _json.dumps(metadata)
-                register_route("WEBSOCKET", path, func, openapi_extra=ws_metadata)
+                _register_native_route("WEBSOCKET", path, func, openapi_extra=ws_metadata)
 
             return func
 
@@ -1997,7 +2357,7 @@ class FastAPIApp:
 
     def routes(self) -> List[Dict[str, Any]]:
         """Get all registered routes."""
-        if HAS_NATIVE:
+        if self._use_native:
             return get_all_routes()
         return []
 
@@ -2056,13 +2416,12 @@ class FastAPIApp:
             # Add to ASGI fallback routes
             if route.path not in self._routes:
                 self._routes[route.path] = {}
-            self._routes[route.path][route.method.upper()] = (
-                route.handler,
-                route.response_model,
+            self._routes[route.path][route.method.upper()] = _Route(
+                route.method.upper(), route.path, route.handler, route.response_model
             )
 
             # Also register with C++ if available
-            if HAS_NATIVE:
+            if self._use_native:
                 decorator = route_decorator(
                     method=route.method,
                     path=route.path,
@@ -2178,7 +2537,7 @@ class FastAPIApp:
             pattern = path + "/{file_path:path}"
 
             # Register route with path parameter
-            if HAS_NATIVE:
+            if self._use_native:
                 parameters = [
                     {
                         "name": "file_path",
@@ -2190,7 +2549,7 @@ class FastAPIApp:
                     }
                 ]
 
-                route_id = register_route(
+                route_id = _register_native_route(
                     method="GET",
                     path_pattern=pattern,
                     handler=static_handler,
@@ -2377,8 +2736,8 @@ class FastAPIApp:
         # Register routes with C++ server
         handler_id = 1
         for path, methods in self._routes.items():
-            for method, route_info in methods.items():
-                handler = route_info[0] if isinstance(route_info, tuple) else route_info
+            for method, route in methods.items():
+                handler = route.handler
 
                 # Register Python handler with callback bridge
                 lib.http_register_python_handler(
@@ -2496,6 +2855,8 @@ class FileResponse:
     the raw bytes with the appropriate Content-Type header.
     """
 
+    __slots__ = ("content", "media_type", "filename")
+
     def __init__(self, content: bytes, media_type: str, filename: str = ""):
         self.content = content
         self.media_type = media_type
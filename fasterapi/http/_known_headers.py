@@ -0,0 +1,89 @@
+"""
+Well-known HTTP header names.
+
+Maps the common spellings of frequently used header names to a single
+lowercase string, so folding a known name is one dict lookup instead of
+a str.lower() allocation, and maps the lowercase names back to their
+canonical wire spelling for HTTP/1.1 output.
+"""
+
+from typing import Dict
+
+_NAMES = (
+    "accept",
+    "accept-encoding",
+    "accept-language",
+    "access-control-allow-origin",
+    "authorization",
+    "cache-control",
+    "connection",
+    "content-disposition",
+    "content-encoding",
+    "content-length",
+    "content-md5",
+    "content-type",
+    "cookie",
+    "date",
+    "dnt",
+    "etag",
+    "expires",
+    "host",
+    "if-modified-since",
+    "if-none-match",
+    "keep-alive",
+    "last-modified",
+    "location",
+    "origin",
+    "referer",
+    "server",
+    "set-cookie",
+    "te",
+    "transfer-encoding",
+    "upgrade",
+    "user-agent",
+    "vary",
+    "www-authenticate",
+    "x-forwarded-for",
+    "x-request-id",
+    "x-xss-protection",
+)
+
+KNOWN_HEADERS: Dict[str, str] = {}
+CANONICAL_HEADERS: Dict[str, str] = {}
+for _name in _NAMES:
+    CANONICAL_HEADERS[_name] = _name.title()
+del _name
+
+# Irregular canonical spellings
+CANONICAL_HEADERS["etag"] = "ETag"
+CANONICAL_HEADERS["www-authenticate"] = "WWW-Authenticate"
+CANONICAL_HEADERS["x-request-id"] = "X-Request-ID"
+CANONICAL_HEADERS["content-md5"] = "Content-MD5"
+CANONICAL_HEADERS["dnt"] = "DNT"
+CANONICAL_HEADERS["te"] = "TE"
+CANONICAL_HEADERS["x-xss-protection"] = "X-XSS-Protection"
+
+for _name, _canonical in CANONICAL_HEADERS.items():
+    KNOWN_HEADERS[_name] = _name
+    KNOWN_HEADERS[_name.upper()] = _name
+    KNOWN_HEADERS[_name.title()] = _name
+    KNOWN_HEADERS[_canonical] = _name
+del _name, _canonical
+
+
+def fold_header_name(name: str) -> str:
+    """Lowercase a header name, skipping the allocation for known names."""
+    folded = KNOWN_HEADERS.get(name)
+    if folded is not None:
+        return folded
+    return name if name.islower() else name.lower()
+
+
+def wire_header_name(name: str) -> str:
+    """Canonical HTTP/1.1 spelling of a lowercase header name."""
+    canonical = CANONICAL_HEADERS.get(name)
+    if canonical is not None:
+        return canonical
+    # Capitalize only the first character of each segment: str.title()
+    # would also capitalize after digits (x-2fa -> X-2Fa)
+    return '-'.join(part[:1].upper() + part[1:] for part in name.split('-'))
@@ -0,0 +1,100 @@
+"""
+Case-insensitive HTTP header mapping.
+"""
+
+from typing import Any, Iterable, Mapping, Tuple, Union
+
+from ._known_headers import fold_header_name
+
+
+class Headers(dict):
+    """
+    Dictionary of HTTP headers with case-insensitive names.
+
+    Names are folded to lowercase once, on insert, so the stored keys are
+    what HTTP/2 and HTTP/3 put on the wire and equality with a plain
+    lowercase dict still holds. Lookups accept any spelling.
+
+    Usage:
+        headers = Headers({"Content-Type": "text/html"})
+        headers["content-type"]  # "text/html"
+        "CONTENT-TYPE" in headers  # True
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        headers: Union[Mapping[str, str], Iterable[Tuple[str, str]], None] = None,
+        **kwargs: str,
+    ):
+        if headers is None:
+            super().__init__()
+        elif isinstance(headers, Mapping) and all(name.islower() for name in headers):
+            # Already folded: let dict copy it in C
+            super().__init__(headers)
+        else:
+            super().__init__()
+            self.update(headers)
+        if kwargs:
+            self.update(kwargs)
+
+    def __getitem__(self, name: str) -> str:
+        return super().__getitem__(fold_header_name(name))
+
+    def __setitem__(self, name: str, value: str) -> None:
+        super().__setitem__(fold_header_name(name), value)
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(fold_header_name(name))
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        return super().__contains__(fold_header_name(name))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return super().get(fold_header_name(name), default)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        return super().pop(fold_header_name(name), *default)
+
+    def setdefault(self, name: str, default: str = "") -> str:
+        return super().setdefault(fold_header_name(name), default)
+
+    def update(self, *args: Any, **kwargs: str) -> None:
+        for other in args + (kwargs,):
+            items = other.items() if isinstance(other, Mapping) else other
+            for name, value in items:
+                super().__setitem__(fold_header_name(name), value)
+
+    def __ior__(self, other: Any) -> "Headers":
+        self.update(other)
+        return self
+
+    def __or__(self, other: Any) -> "Headers":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other: Any) -> "Headers":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        merged = Headers(other)
+        merged.update(self)
+        return merged
+
+    @classmethod
+    def fromkeys(cls, names: Iterable[str], value: Any = None) -> "Headers":
+        headers = cls()
+        for name in names:
+            headers[name] = value
+        return headers
+
+    def copy(self) -> "Headers":
+        return Headers(self)
+
+    def __repr__(self) -> str:
+        return f"Headers({super().__repr__()})"
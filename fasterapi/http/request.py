@@ -7,12 +7,44 @@ FastAPI-compatible async methods for body access.
 
 import asyncio
 import json as json_module
+import re
+import urllib.parse
 from enum import Enum
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional, Union
 
 # Import data structures
 from fasterapi.datastructures import URL, Address, FormData, State, UploadFile
 
+from .headers import Headers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Integers beyond 64 bits: newer orjson rejects them with JSONDecodeError,
+# which falls back to json below. Older releases silently return a float;
+# only with those is a body that has such a number token re-parsed by json.
+# 19 digits is the shortest run that can fall outside int64 (below its minimum)
+_WIDE_INT = re.compile(rb"(?:^|[\[:,])\s*-?\d{19}")
+_ORJSON_ROUNDS_WIDE_INTS = False
+if orjson is not None:
+    try:
+        _ORJSON_ROUNDS_WIDE_INTS = isinstance(orjson.loads(b"18446744073709551616"), float)
+    except orjson.JSONDecodeError:
+        pass
+
+# Shared read-only stand-ins for requests without headers or parameters.
+# Internal reads use them as-is; the public attributes swap in a real,
+# mutable mapping on first access, so only requests whose headers or
+# params are actually touched allocate one
+_NO_HEADERS: Mapping[str, str] = MappingProxyType(Headers())
+_NO_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Marks a body whose JSON has not been parsed yet (null is a valid body)
+_UNSET: Any = object()
+
 
 class Method(Enum):
     """HTTP methods."""
@@ -28,6 +60,41 @@ class Method(Enum):
     TRACE = "TRACE"
 
 
+# Method members by upper- and lowercase name, so the usual spellings skip
+# str.upper() and the Enum value lookup
+_METHODS: Dict[str, Method] = {m.value: m for m in Method}
+_METHODS.update({m.value.lower(): m for m in Method})
+
+
+def _split_urlencoded(body: str) -> list:
+    """Split a form body with no escapes, keeping parse_qsl's blank handling."""
+    pairs = []
+    for field in body.split("&"):
+        key, _, value = field.partition("=")
+        if value:
+            pairs.append((key, value))
+    return pairs
+
+
+def _loads(body: bytes) -> Any:
+    """
+    Decode a JSON body, straight from bytes with orjson when installed.
+
+    Input orjson rejects (NaN, invalid JSON, integers wider than 64 bits)
+    goes through the stdlib parser, which accepts the first and last and
+    reports the rest.
+    """
+    if orjson is not None:
+        try:
+            value = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if not (_ORJSON_ROUNDS_WIDE_INTS and _WIDE_INT.search(body)):
+                return value
+    return json_module.loads(body.decode("utf-8"))
+
+
 class Request:
     """
     HTTP request object with zero-copy access to headers and body.
@@ -48,6 +115,31 @@ class Request:
     - Request.state for middleware data
     """
 
+    __slots__ = (
+        "method",
+        "path",
+        "query",
+        "version",
+        "protocol",
+        "_headers",
+        "_query_params",
+        "_path_params",
+        "_body",
+        "_body_bytes",
+        "_client_ip",
+        "_client_port",
+        "request_id",
+        "timestamp",
+        "secure",
+        "scope",
+        "_receive",
+        "_json",
+        "_form",
+        "_ct_parsed",
+        "_body_consumed",
+        "_state",
+    )
+
     def __init__(self, method: str = "GET", path: str = "/", **kwargs):
         """
         Create a new HTTP request.
@@ -57,14 +149,15 @@ class Request:
             path: Request path
             **kwargs: Additional request data
         """
-        self.method = Method(method.upper())
+        self.method = _METHODS.get(method) or Method(method.upper())
         self.path = path
         self.query = kwargs.get("query", "")
         self.version = kwargs.get("version", "HTTP/1.1")
         self.protocol = kwargs.get("protocol", "HTTP/1.1")
-        self._headers = kwargs.get("headers", {})
-        self.query_params = kwargs.get("query_params", {})
-        self.path_params = kwargs.get("path_params", {})
+        headers = kwargs.get("headers")
+        self._headers = Headers(headers) if headers else _NO_HEADERS
+        self._query_params = kwargs.get("query_params", _NO_PARAMS)
+        self._path_params = kwargs.get("path_params", _NO_PARAMS)
         self._body = kwargs.get("body", "")
         self._body_bytes = kwargs.get("body_bytes", b"")
         self._client_ip = kwargs.get("client_ip", "127.0.0.1")
@@ -80,13 +173,73 @@ class Request:
         self._receive: Optional[Callable[[], Awaitable[dict]]] = kwargs.get("receive")
 
         # Cached parsed data
-        self._json: Any = None
+        self._json: Any = _UNSET
         self._form: Optional[FormData] = None
+        self._ct_parsed: Optional[tuple] = None
         self._body_consumed = False
 
         # Request state for middleware
         self._state = State()
 
+    @classmethod
+    def from_raw(cls, data: bytes, **kwargs) -> "Request":
+        """
+        Build a request from raw HTTP/1.x bytes.
+
+        Lines and separators are located with bytes.find(), which is
+        memchr-backed, so the head is never walked byte by byte in Python.
+
+        Args:
+            data: Request line, headers, blank line and (optionally) body
+            **kwargs: Additional request data, as for the constructor
+
+        Returns:
+            Parsed request
+
+        Raises:
+            ValueError: If the head is incomplete or malformed
+        """
+        head_end = data.find(b"\r\n\r\n")
+        if head_end < 0:
+            raise ValueError("Incomplete HTTP request head")
+
+        line_end = data.find(b"\r\n")
+        request_line = data[:line_end].decode("latin-1").split(" ")
+        if len(request_line) != 3:
+            raise ValueError("Malformed HTTP request line")
+        method, target, version = request_line
+
+        # The first occurrence of a repeated header wins, as in the native
+        # parser; two parsers disagreeing on Content-Length or Host would
+        # open the door to request smuggling
+        headers = Headers()
+        pos = line_end + 2
+        while pos < head_end:
+            eol = data.find(b"\r\n", pos)
+            colon = data.find(b":", pos, eol)
+            if colon < 0:
+                raise ValueError("Malformed HTTP header line")
+            headers.setdefault(
+                data[pos:colon].decode("latin-1"),
+                data[colon + 1 : eol].strip().decode("latin-1"),
+            )
+            pos = eol + 2
+
+        path, _, query = target.partition("?")
+        query_params = dict(urllib.parse.parse_qsl(query, keep_blank_values=True))
+
+        return cls(
+            method=method,
+            path=path,
+            query=query,
+            version=version,
+            protocol=version,
+            headers=headers,
+            query_params=query_params,
+            body_bytes=data[head_end + 4 :],
+            **kwargs,
+        )
+
     def get_method(self) -> Method:
         """Get HTTP method."""
         return self.method
@@ -110,8 +263,32 @@ class Request:
     @property
     def headers(self) -> Dict[str, str]:
         """Get all headers (FastAPI-compatible property)."""
+        if self._headers is _NO_HEADERS:
+            self._headers = Headers()
         return self._headers
 
+    @property
+    def query_params(self) -> Dict[str, str]:
+        """Get parsed query parameters."""
+        if self._query_params is _NO_PARAMS:
+            self._query_params = {}
+        return self._query_params
+
+    @query_params.setter
+    def query_params(self, query_params: Dict[str, str]) -> None:
+        self._query_params = query_params
+
+    @property
+    def path_params(self) -> Dict[str, str]:
+        """Get path parameters extracted from the route pattern."""
+        if self._path_params is _NO_PARAMS:
+            self._path_params = {}
+        return self._path_params
+
+    @path_params.setter
+    def path_params(self, path_params: Dict[str, str]) -> None:
+        self._path_params = path_params
+
     @property
     def url(self) -> URL:
         """Get request URL (FastAPI-compatible property)."""
@@ -199,10 +376,14 @@ class Request:
         Returns:
             Header value, or empty string if not found
         """
-        return self._headers.get(name.lower(), "")
+        return self._headers.get(name, "")
+
+    def get_headers(self) -> Mapping[str, str]:
+        """Get all headers as a read-only view (no copy)."""
+        return MappingProxyType(self._headers)
 
-    def get_headers(self) -> Dict[str, str]:
-        """Get all headers."""
+    def copy_headers(self) -> Dict[str, str]:
+        """Get a mutable copy of all headers."""
         return self._headers.copy()
 
     def get_query_param(self, name: str) -> str:
@@ -215,7 +396,7 @@ class Request:
         Returns:
             Parameter value, or empty string if not found
         """
-        return self.query_params.get(name, "")
+        return self._query_params.get(name, "")
 
     def get_path_param(self, name: str) -> str:
         """
@@ -227,7 +408,7 @@ class Request:
         Returns:
             Parameter value, or empty string if not found
         """
-        return self.path_params.get(name, "")
+        return self._path_params.get(name, "")
 
     def get_body(self) -> str:
         """Get request body."""
@@ -248,15 +429,25 @@ class Request:
         except ValueError:
             return 0
 
+    def get_media_type(self) -> str:
+        """Get the lowercased media type, without parameters such as charset."""
+        content_type = self.get_content_type()
+        parsed = self._ct_parsed
+        # Reparse only if the header value itself has changed
+        if parsed is None or parsed[0] is not content_type:
+            parsed = self._ct_parsed = (
+                content_type,
+                content_type.partition(";")[0].strip().lower(),
+            )
+        return parsed[1]
+
     def is_json(self) -> bool:
         """Check if request has JSON body."""
-        content_type = self.get_content_type().lower()
-        return "application/json" in content_type
+        return self.get_media_type() == "application/json"
 
     def is_multipart(self) -> bool:
         """Check if request has multipart body."""
-        content_type = self.get_content_type().lower()
-        return "multipart/form-data" in content_type
+        return self.get_media_type() == "multipart/form-data"
 
     def get_client_ip(self) -> str:
         """Get client IP address."""
@@ -331,7 +522,7 @@ class Request:
             ValueError: If body is not valid JSON
         """
         # Return cached JSON if available
-        if self._json is not None:
+        if self._json is not _UNSET:
             return self._json
 
         body_bytes = await self.body()
@@ -340,7 +531,7 @@ class Request:
             raise ValueError("Request body is empty")
 
         try:
-            self._json = json_module.loads(body_bytes.decode("utf-8"))
+            self._json = _loads(body_bytes)
             return self._json
         except json_module.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
@@ -360,20 +551,23 @@ class Request:
 
         # Keep original content_type for boundary parsing (case-sensitive)
         content_type = self.get_content_type()
-        content_type_lower = content_type.lower()
+        media_type = self.get_media_type()
         body_bytes = await self.body()
 
         self._form = FormData()
 
-        if "multipart/form-data" in content_type_lower:
+        if media_type == "multipart/form-data":
             # Parse multipart form data (use original content_type for boundary)
             self._form = await self._parse_multipart(body_bytes, content_type)
-        elif "application/x-www-form-urlencoded" in content_type_lower:
+        elif media_type == "application/x-www-form-urlencoded":
             # Parse URL-encoded form data
-            import urllib.parse
-
             body_str = body_bytes.decode("utf-8")
-            for key, value in urllib.parse.parse_qsl(body_str):
+            if "%" in body_str or "+" in body_str:
+                pairs = urllib.parse.parse_qsl(body_str)
+            else:
+                # Nothing to unquote: plain str splits do the same job in C
+                pairs = _split_urlencoded(body_str)
+            for key, value in pairs:
                 self._form[key] = value
 
         return self._form
@@ -505,16 +699,16 @@ class Request:
 
         For use in non-async contexts. Prefer async json() method.
         """
-        if self._json is not None:
+        if self._json is not _UNSET:
             return self._json
 
-        body = self._body_bytes or self._body.encode("utf-8") if self._body else b""
+        body = self._body_bytes or (self._body.encode("utf-8") if self._body else b"")
 
         if not body:
             raise ValueError("Request body is empty")
 
         try:
-            self._json = json_module.loads(body.decode("utf-8"))
+            self._json = _loads(body)
             return self._json
         except json_module.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
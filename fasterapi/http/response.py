@@ -4,8 +4,16 @@ HTTP Response Python Wrapper
 Streaming response with compression support.
 """
 
-from typing import Dict, Any, Optional, Union, List
+import json as json_module
+import mmap
+import os
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Union, List
 from enum import Enum
+from http import HTTPStatus
+
+from ._known_headers import wire_header_name
+from .headers import Headers
 
 
 class Status(Enum):
@@ -30,6 +38,45 @@ class Status(Enum):
     SERVICE_UNAVAILABLE = 503
 
 
+# Members by code and by name, so status lookups are plain dict hits
+# rather than Enum calls
+_STATUS_BY_INT: Dict[int, Status] = {s.value: s for s in Status}
+_STATUS_BY_NAME: Dict[str, Status] = dict(Status.__members__)
+
+# HTTP/1.1 status lines, serialized once at import
+_STATUS_LINES: Dict[Status, bytes] = {
+    s: f"HTTP/1.1 {s.value} {HTTPStatus(s.value).phrase}\r\n".encode("ascii")
+    for s in Status
+}
+
+
+@lru_cache(maxsize=256)
+def _header_prefix(name: str, title_case: bool) -> bytes:
+    """
+    Encode the "name: " part of a header line.
+    
+    Names repeat across responses while values (content-length, date,
+    etag, ...) mostly don't, so only the name side is cached.
+    """
+    if title_case:
+        name = wire_header_name(name)
+    return f"{name}: ".encode('latin-1')
+
+
+def _header_value(value: Any) -> bytes:
+    """
+    Encode a header or cookie value for the wire.
+    
+    Raises:
+        ValueError: If the value contains CR or LF, which would let it
+            start a new header line (response splitting)
+    """
+    value = str(value)
+    if '\r' in value or '\n' in value:
+        raise ValueError(f"Header value contains CR or LF: {value!r}")
+    return value.encode('latin-1')
+
+
 class Response:
     """
     HTTP response object with streaming and compression support.
@@ -42,11 +89,31 @@ class Response:
     - Chunked transfer encoding
     - HTTP/2 server push
     """
+
+    __slots__ = (
+        "status_code",
+        "_headers",
+        "_set_cookies",
+        "_set_cookie_value",
+        "_file",
+        "body",
+        "is_sent",
+        "compression_enabled",
+        "compression_level",
+        "original_size",
+        "compressed_size",
+    )
     
     def __init__(self):
         """Create a new HTTP response."""
         self.status_code = Status.OK
-        self.headers: Dict[str, str] = {}
+        self._headers: Dict[str, str] = Headers()
+        # One entry per cookie() call, valid only while the set-cookie header
+        # is still the exact string cookie() last wrote (_set_cookie_value)
+        self._set_cookies: Optional[List[str]] = None
+        self._set_cookie_value: Optional[str] = None
+        # (path, size) for file responses; the body is never read into memory
+        self._file: Optional[Tuple[str, int]] = None
         self.body = ""
         self.is_sent = False
         self.compression_enabled = True
@@ -54,6 +121,16 @@ class Response:
         self.original_size = 0
         self.compressed_size = 0
     
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Response headers; multiple cookies appear comma-joined under set-cookie."""
+        return self._headers
+    
+    @headers.setter
+    def headers(self, headers: Dict[str, str]) -> None:
+        self._headers = Headers(headers)
+        self._set_cookies = self._set_cookie_value = None
+    
     def status(self, status: Union[Status, int]) -> 'Response':
         """
         Set HTTP status code.
@@ -65,11 +142,27 @@ class Response:
             Self for method chaining
         """
         if isinstance(status, int):
-            self.status_code = Status(status)
+            self.status_code = _STATUS_BY_INT.get(status) or Status(status)
         else:
             self.status_code = status
         return self
     
+    def set_status_by_name(self, name: str) -> 'Response':
+        """
+        Set HTTP status code from a Status member name.
+        
+        Args:
+            name: Member name, e.g. "NOT_FOUND"
+            
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            KeyError: If no status has that name
+        """
+        self.status_code = _STATUS_BY_NAME[name]
+        return self
+    
     def header(self, name: str, value: str) -> 'Response':
         """
         Set response header.
@@ -81,7 +174,7 @@ class Response:
         Returns:
             Self for method chaining
         """
-        self.headers[name.lower()] = value
+        self._headers[name] = value
         return self
     
     def content_type(self, content_type: str) -> 'Response':
@@ -96,6 +189,13 @@ class Response:
         """
         return self.header('content-type', content_type)
     
+    def _set_body(self, body: str, content_type: str) -> 'Response':
+        """Store an in-memory body and its content type in one step."""
+        self.body = body
+        self._file = None
+        self._headers['content-type'] = content_type
+        return self
+    
     def json(self, data: Union[Dict[str, Any], List[Any], str]) -> 'Response':
         """
         Send JSON response.
@@ -106,12 +206,9 @@ class Response:
         Returns:
             Self for method chaining
         """
-        import json
-        if isinstance(data, str):
-            self.body = data
-        else:
-            self.body = json.dumps(data)
-        return self.content_type('application/json')
+        if not isinstance(data, str):
+            data = json_module.dumps(data)
+        return self._set_body(data, 'application/json')
     
     def text(self, text: str) -> 'Response':
         """
@@ -123,8 +220,7 @@ class Response:
         Returns:
             Self for method chaining
         """
-        self.body = text
-        return self.content_type('text/plain')
+        return self._set_body(text, 'text/plain')
     
     def html(self, html: str) -> 'Response':
         """
@@ -136,8 +232,7 @@ class Response:
         Returns:
             Self for method chaining
         """
-        self.body = html
-        return self.content_type('text/html')
+        return self._set_body(html, 'text/html')
     
     def binary(self, data: bytes) -> 'Response':
         """
@@ -149,13 +244,16 @@ class Response:
         Returns:
             Self for method chaining
         """
-        self.body = data.decode('latin-1')  # Store as string for now
-        return self.content_type('application/octet-stream')
+        # Store as string for now
+        return self._set_body(data.decode('latin-1'), 'application/octet-stream')
     
     def file(self, file_path: str) -> 'Response':
         """
         Send file response.
         
+        Only the path and size are recorded; the contents go straight from
+        the page cache to the client in sendfile().
+        
         Args:
             file_path: Path to file
             
@@ -164,35 +262,58 @@ class Response:
         """
         try:
             with open(file_path, 'rb') as f:
-                data = f.read()
-            return self.binary(data)
+                size = os.fstat(f.fileno()).st_size
         except FileNotFoundError:
             return self.status(Status.NOT_FOUND).text("File not found")
+        self.body = ""
+        self._file = (file_path, size)
+        return self.content_type('application/octet-stream')
     
-    def compress(self, enable: bool = True) -> 'Response':
+    def sendfile(self, out_fd: int) -> int:
         """
-        Enable compression for this response.
+        Write a file response's contents to a socket or file descriptor.
+        
+        Uses os.sendfile() where the platform has it, so the data never
+        passes through Python; otherwise writes from a read-only mmap of
+        the file, which also avoids copying it into Python bytes.
         
         Args:
-            enable: Enable compression
+            out_fd: Destination file descriptor
             
         Returns:
-            Self for method chaining
+            Number of bytes written
         """
-        self.compression_enabled = enable
-        return self
+        if self._file is None:
+            raise ValueError("Response is not a file response")
+        path, size = self._file
+        written = 0
+        with open(path, 'rb') as f:
+            if hasattr(os, 'sendfile'):
+                while written < size:
+                    sent = os.sendfile(out_fd, f.fileno(), written, size - written)
+                    if sent == 0:
+                        break
+                    written += sent
+                return written
+            if size == 0:
+                return 0
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    while written < size:
+                        written += os.write(out_fd, view[written:])
+        return written
     
-    def compression_level(self, level: int) -> 'Response':
+    def compress(self, enable: bool = True) -> 'Response':
         """
-        Set compression level.
+        Enable compression for this response.
         
         Args:
-            level: Compression level (1-22 for zstd)
+            enable: Enable compression
             
         Returns:
             Self for method chaining
         """
-        self.compression_level = level
+        self.compression_enabled = enable
         return self
     
     def redirect(self, url: str, permanent: bool = False) -> 'Response':
@@ -233,15 +354,45 @@ class Response:
         for key, val in options.items():
             cookie_str += f"; {key}={val}"
         
-        # Add to existing Set-Cookie header or create new one
-        existing = self.headers.get('set-cookie', '')
-        if existing:
-            self.headers['set-cookie'] = f"{existing}, {cookie_str}"
-        else:
-            self.headers['set-cookie'] = cookie_str
+        # Keep one entry per cookie for serializers, alongside the combined
+        # value that .headers has always exposed
+        existing = self._headers.get('set-cookie')
+        cookies = self._cookie_list()
+        if cookies is None:
+            cookies = self._set_cookies = [existing] if existing else []
+        cookies.append(cookie_str)
+        value = f"{existing}, {cookie_str}" if existing else cookie_str
+        self._headers['set-cookie'] = value
+        self._set_cookie_value = value
         
         return self
     
+    def get_set_cookies(self) -> List[str]:
+        """
+        Get cookies set on this response, one Set-Cookie value each.
+        
+        Set-Cookie can't be comma-folded, so serializers should emit one
+        header line per entry.
+        """
+        cookies = self._cookie_list()
+        if cookies is not None:
+            return list(cookies)
+        existing = self._headers.get('set-cookie')
+        return [existing] if existing else []
+    
+    def _cookie_list(self) -> Optional[List[str]]:
+        """
+        The per-cookie list, or None once the header no longer matches it.
+        
+        The header map is the source of truth: any write or delete of
+        set-cookie through .headers replaces the string cookie() stored,
+        which drops the list.
+        """
+        cookies = self._set_cookies
+        if cookies is not None and self._headers.get('set-cookie') is not self._set_cookie_value:
+            cookies = self._set_cookies = self._set_cookie_value = None
+        return cookies
+    
     def clear_cookie(self, name: str, path: str = "/") -> 'Response':
         """
         Clear cookie.
@@ -265,23 +416,67 @@ class Response:
         if self.is_sent:
             return 0
         
-        # Apply compression if enabled
-        if self.compression_enabled and len(self.body) > 1024:
+        # Apply compression if enabled (file responses go out uncompressed
+        # through sendfile)
+        if self.compression_enabled and self._file is None and len(self.body) > 1024:
             # This would apply zstd compression
             # For now, just mark as compressed
             self.compressed_size = len(self.body)  # Placeholder
-            self.headers['content-encoding'] = 'zstd'
+            self._headers['content-encoding'] = 'zstd'
         
-        self.original_size = len(self.body)
+        self.original_size = self.get_size()
         self.is_sent = True
         return 0
     
-    def is_sent(self) -> bool:
-        """Check if response has been sent."""
-        return self.is_sent
+    def status_line(self) -> bytes:
+        """Get the pre-serialized HTTP/1.1 status line, CRLF included."""
+        return _STATUS_LINES[self.status_code]
+    
+    def render_head(self, title_case: bool = False) -> bytearray:
+        """
+        Serialize the status line and headers for HTTP/1.1.
+        
+        Everything is written into one bytearray, ending with the blank
+        line that separates head from body. Each cookie gets its own
+        Set-Cookie line.
+        
+        Only the headers already set are written: no Content-Length or
+        Transfer-Encoding is added, so the caller must set the framing
+        header (e.g. header('content-length', ...) from the encoded body or
+        get_size() for files) before rendering a keep-alive response.
+        
+        Args:
+            title_case: Write names in canonical case (Content-Type) for
+                clients that compare them case-sensitively
+        
+        Returns:
+            Status line and headers as they are set, framing included only
+            if the caller added it
+        
+        Raises:
+            ValueError: If a header or cookie value contains CR or LF
+        """
+        buf = bytearray(_STATUS_LINES[self.status_code])
+        cookies = self._cookie_list()
+        for name, value in self._headers.items():
+            if cookies and name == 'set-cookie':
+                continue
+            buf += _header_prefix(name, title_case)
+            buf += _header_value(value)
+            buf += b"\r\n"
+        if cookies:
+            cookie_prefix = _header_prefix('set-cookie', title_case)
+            for cookie in cookies:
+                buf += cookie_prefix
+                buf += _header_value(cookie)
+                buf += b"\r\n"
+        buf += b"\r\n"
+        return buf
     
     def get_size(self) -> int:
         """Get response size."""
+        if self._file is not None:
+            return self._file[1]
         return len(self.body)
     
     def get_compression_ratio(self) -> float:
@@ -292,4 +487,4 @@ class Response:
     
     def __repr__(self) -> str:
         """String representation of response."""
-        return f"Response(status={self.status_code.value}, size={len(self.body)})"
+        return f"Response(status={self.status_code.value}, size={self.get_size()})"
@@ -11,6 +11,7 @@ import inspect
 import re
 from typing import Optional, Callable, Dict, Any, Union, get_type_hints
 from .bindings import get_lib, _error_from_code
+from .._typing import pydantic_base_model
 import sys
 
 
@@ -20,12 +21,9 @@ def _is_body_parameter(param_type) -> bool:
         return False
 
     # Check for Pydantic BaseModel
-    try:
-        from pydantic import BaseModel
-        if isinstance(param_type, type) and issubclass(param_type, BaseModel):
-            return True
-    except ImportError:
-        pass
+    base_model = pydantic_base_model()
+    if base_model is not None and isinstance(param_type, type) and issubclass(param_type, base_model):
+        return True
 
     # Check for dict type
     origin = getattr(param_type, '__origin__', None)
@@ -24,14 +24,6 @@ Usage:
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Type, Union
 
-try:
-    from pydantic import BaseModel
-
-    HAS_PYDANTIC = True
-except ImportError:
-    HAS_PYDANTIC = False
-    BaseModel = object
-
 from fasterapi.params import Depends
 
 
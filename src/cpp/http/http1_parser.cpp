@@ -67,7 +67,14 @@ int HTTP1Parser::parse(
         return state_ == HTTP1State::ERROR ? 1 : -1;
     }
     
-    // 4. Parse headers
+    // 4. Parse headers. The few the parser acts on are picked out as they
+    // are parsed (first occurrence wins, as with get_header) rather than
+    // rescanning the header list once per name afterwards.
+    std::string_view content_len;
+    std::string_view transfer_enc;
+    std::string_view connection;
+    std::string_view upgrade;
+
     while (pos_ < len) {
         // Check for end of headers (empty line)
         if (pos_ + 1 < len && data[pos_] == '\r' && data[pos_ + 1] == '\n') {
@@ -83,31 +90,49 @@ int HTTP1Parser::parse(
         if (parse_header_value(data, len, out_request) != 0) {
             return state_ == HTTP1State::ERROR ? 1 : -1;
         }
+
+        const auto& header = out_request.headers[out_request.header_count - 1];
+        std::string_view* known = nullptr;
+        switch (header.name.size()) {
+            case 7:
+                if (str_eq_ci(header.name, "upgrade")) known = &upgrade;
+                break;
+            case 10:
+                if (str_eq_ci(header.name, "connection")) known = &connection;
+                break;
+            case 14:
+                if (str_eq_ci(header.name, "content-length")) known = &content_len;
+                break;
+            case 17:
+                if (str_eq_ci(header.name, "transfer-encoding")) known = &transfer_enc;
+                break;
+            default:
+                break;
+        }
+        if (known && known->data() == nullptr) {
+            *known = header.value;
+        }
     }
 
     // Parse URL components
     parse_url_components(out_request);
 
     // Extract important headers
-    auto content_len = out_request.get_header("content-length");
     if (!content_len.empty()) {
         out_request.content_length = std::stoull(std::string(content_len));
         out_request.has_content_length = true;
     }
 
-    auto transfer_enc = out_request.get_header("transfer-encoding");
     if (!transfer_enc.empty() && transfer_enc.find("chunked") != std::string_view::npos) {
         out_request.chunked = true;
     }
 
-    auto connection = out_request.get_header("connection");
     if (out_request.version == HTTP1Version::HTTP_1_1) {
         out_request.keep_alive = connection.empty() || str_eq_ci(connection, "keep-alive");
     } else {
         out_request.keep_alive = str_eq_ci(connection, "keep-alive");
     }
 
-    auto upgrade = out_request.get_header("upgrade");
     if (!upgrade.empty()) {
         out_request.upgrade = true;
         out_request.upgrade_protocol = upgrade;
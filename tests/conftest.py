@@ -2,12 +2,18 @@
 
 import os
 import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Optional
 
 import pytest
 
+# Make the in-tree package importable without an install.
+_p = str(Path(__file__).resolve().parent.parent)
+if _p not in sys.path:
+    sys.path.insert(0, _p)
+
 from fasterapi.pg import PgPool
 
 
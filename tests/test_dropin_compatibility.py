@@ -201,6 +201,38 @@ class TestResponseModelFiltering:
             assert status == 200
             assert "password" not in result
 
+    @pytest.mark.asyncio
+    async def test_unvalidated_response_still_filtered(self):
+        """response_model_validate=False skips validation but not filtering."""
+        app = FastAPI()
+
+        @app.post("/user-trusted", response_model=UserOut, response_model_validate=False)
+        def create_user(user: UserIn):
+            return {**user.model_dump(), "internal_id": 12345}
+
+        @app.get("/users-trusted", response_model=List[UserOut], response_model_validate=False)
+        def list_users():
+            return [
+                {"username": random_string(), "email": random_email(), "password": "x"}
+                for _ in range(5)
+            ]
+
+        username, email = random_string(), random_email()
+        status, result, _ = await asgi_request(
+            app,
+            "POST",
+            "/user-trusted",
+            body={"username": username, "password": random_string(20), "email": email},
+            headers={"content-type": "application/json"},
+        )
+        assert status == 200
+        assert result == {"username": username, "email": email}
+
+        status, result, _ = await asgi_request(app, "GET", "/users-trusted")
+        assert status == 200
+        assert len(result) == 5
+        assert all(set(user) == {"username", "email"} for user in result)
+
 
 # ============================================================================
 # Test 2: Dependency Injection
@@ -19,8 +19,10 @@ This enables us to verify FastAPI code compatibility before integration testing.
 
 import sys
 import inspect
+import json
 import random
 import string
+from types import CodeType, FunctionType
 from typing import Any, Optional, List, Dict, Union
 from dataclasses import dataclass
 from unittest.mock import patch, MagicMock
@@ -33,6 +35,7 @@ sys.path.insert(0, '/Users/bengamble/FasterAPI')
 from fasterapi.fastapi_compat import (
     python_type_to_string,
     extract_function_parameters,
+    extract_function_parameters_by_name,
     PYTHON_TYPE_MAP,
 )
 
@@ -72,6 +75,25 @@ def random_int(min_val: int = 1, max_val: int = 1000) -> int:
     return random.randint(min_val, max_val)
 
 
+# Compiled `def handler(_0, ..., _n): pass` bodies, one per arity
+_HANDLER_CODE: Dict[int, CodeType] = {}
+
+
+def make_handler(param_names: List[str], annotation: Any):
+    """Build `def handler(<param_names>: annotation): pass` without exec()."""
+    arity = len(param_names)
+    code = _HANDLER_CODE.get(arity)
+    if code is None:
+        source = f"def handler({', '.join(f'_{i}' for i in range(arity))}): pass"
+        module_code = compile(source, '<handler>', 'exec')
+        code = next(c for c in module_code.co_consts if isinstance(c, CodeType))
+        _HANDLER_CODE[arity] = code
+
+    handler = FunctionType(code.replace(co_varnames=tuple(param_names)), {})
+    handler.__annotations__ = dict.fromkeys(param_names, annotation)
+    return handler
+
+
 # Skip markers
 requires_pydantic = pytest.mark.skipif(
     not HAS_PYDANTIC,
@@ -144,6 +166,13 @@ class TestPythonTypeToString:
         # Order shouldn't matter
         assert python_type_to_string(Union[None, str]) == 'string'
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions need 3.10+")
+    def test_pep604_optional(self):
+        """Test `T | None` unions map like Optional[T]."""
+        assert python_type_to_string(int | None) == 'integer'
+        assert python_type_to_string(None | float) == 'float'
+        assert python_type_to_string(List[str] | None) == 'array'
+
     def test_any_type(self):
         """Test Any type defaults to 'any'."""
         assert python_type_to_string(Any) == 'any'
@@ -441,10 +470,7 @@ class TestExtractFunctionParameters:
         """Test with randomized path parameter names."""
         for _ in range(20):
             param_name = random_string(8)
-            param_code = f"def handler({param_name}: int): pass"
-            local_ns = {}
-            exec(param_code, {}, local_ns)
-            handler = local_ns['handler']
+            handler = make_handler([param_name], int)
 
             path = f'/resource/{{{param_name}}}'
             params = extract_function_parameters(handler, path, 'GET')
@@ -452,6 +478,65 @@ class TestExtractFunctionParameters:
             assert params[0]['name'] == param_name
             assert params[0]['location'] == 'path'
 
+    def test_parameters_by_name_matches_list(self):
+        """Test by-name extraction keeps signature order and list contents."""
+        def handler(org_id: str, item_id: int, q: str = None, page: int = 1):
+            pass
+
+        path = '/orgs/{org_id}/items/{item_id}'
+        by_name = extract_function_parameters_by_name(handler, path, 'PUT')
+        params = extract_function_parameters(handler, path, 'PUT')
+
+        assert list(by_name) == ['org_id', 'item_id', 'q', 'page']
+        assert list(by_name.values()) == params
+        assert by_name['item_id']['location'] == 'path'
+        assert by_name['page']['default'] == '1'
+
+    def test_repeated_extraction_is_cached_but_independent(self):
+        """Repeat calls hit the cache yet return fresh, mutable definitions."""
+        def handler(item_id: int, q: str = None):
+            pass
+
+        first = extract_function_parameters(handler, '/items/{item_id}', 'GET')
+        first[0]['location'] = 'query'
+        first.pop()
+
+        second = extract_function_parameters(handler, '/items/{item_id}', 'GET')
+        assert [p['name'] for p in second] == ['item_id', 'q']
+        assert second[0]['location'] == 'path'
+
+        # Same handler on a different route is analyzed separately
+        other = extract_function_parameters(handler, '/items', 'GET')
+        assert other[0]['location'] == 'query'
+
+    def test_string_and_generic_annotations_resolved(self):
+        """Forward-reference strings and generics still resolve to types."""
+        def handler(item_id: 'int', tags: List[str], q: 'Optional[str]' = None):
+            pass
+
+        params = extract_function_parameters(handler, '/items/{item_id}', 'GET')
+        types = {p['name']: p['type'] for p in params}
+        assert types == {'item_id': 'integer', 'tags': 'array', 'q': 'string'}
+
+    def test_keyword_only_and_wrapped_handlers(self):
+        """Keyword-only defaults and functools.wraps chains are honored."""
+        from functools import wraps
+
+        def handler(item_id: int, *, limit: int = 10, q: str):
+            pass
+
+        @wraps(handler)
+        def wrapped(*args, **kwargs):
+            return handler(*args, **kwargs)
+
+        for func in (handler, wrapped):
+            params = extract_function_parameters(func, '/items/{item_id}', 'GET')
+            by_name = {p['name']: p for p in params}
+            assert list(by_name) == ['item_id', 'limit', 'q']
+            assert by_name['limit']['default'] == '10'
+            assert not by_name['limit']['required']
+            assert by_name['q']['required']
+
 
 # =============================================================================
 # Pydantic Schema Extraction Tests
@@ -592,6 +677,22 @@ class TestExtractPydanticSchema:
         assert 'name' in field_names
         assert 'description' in field_names
 
+    def test_repeated_extraction_returns_independent_copies(self):
+        """Test cached schema extraction doesn't leak mutations between calls."""
+        class Order(BaseModel):
+            order_id: int
+            note: str = "none"
+
+        first = extract_pydantic_schema(Order)
+        first['fields'][0]['type'] = 'mutated'
+        first['fields'].clear()
+
+        second = extract_pydantic_schema(Order, "OrderSchema")
+        assert second['name'] == 'OrderSchema'
+        assert [f['name'] for f in second['fields']] == ['order_id', 'note']
+        assert second['fields'][0]['type'] == 'integer'
+        assert second['fields'][1]['default'] == 'none'
+
     def test_non_pydantic_returns_empty(self):
         """Test that non-Pydantic class returns empty fields."""
         class RegularClass:
@@ -870,6 +971,71 @@ class TestRouteDecorator:
         assert asyncio.iscoroutinefunction(decorated)
 
 
+class TestNativeRouteRegistration:
+    """Tests for the handler route_decorator hands to the C++ registry."""
+
+    def setup_method(self):
+        """Enable the native path with register_route captured."""
+        import fasterapi.fastapi_compat as compat
+        self.registered = {}
+        self.original_native = compat.HAS_NATIVE
+        compat.HAS_NATIVE = True
+        self.patcher = patch.object(
+            compat, 'register_route', create=True,
+            side_effect=lambda **kw: self.registered.update(kw) or 0
+        )
+        self.patcher.start()
+
+    def teardown_method(self):
+        """Restore native bindings state."""
+        import fasterapi.fastapi_compat as compat
+        self.patcher.stop()
+        compat.HAS_NATIVE = self.original_native
+
+    def test_http_exception_dict_detail_is_json(self):
+        """Test a dict detail reaches the registry as a JSON body, not a repr."""
+        from fasterapi.fastapi_compat import route_decorator
+        from fasterapi.exceptions import HTTPException
+
+        detail = {"code": random_string(8), "fields": ["name", "email"]}
+
+        def handler(item_id: int):
+            raise HTTPException(status_code=404, detail=detail)
+
+        decorated = route_decorator('GET', '/items/{item_id}')(handler)
+        assert decorated is handler
+
+        body, status = self.registered['handler'](item_id=1)
+        assert status == 404
+        assert body == {"detail": detail}
+        assert json.loads(json.dumps(body)) == {"detail": detail}
+
+    def test_http_exception_list_detail_keeps_headers(self):
+        """Test a list detail and custom headers are both passed through."""
+        from fasterapi.fastapi_compat import route_decorator
+        from fasterapi.exceptions import HTTPException
+
+        detail = [{"loc": ["query", "q"], "msg": "bad"}]
+
+        def handler():
+            raise HTTPException(status_code=400, detail=detail, headers={"X-Error": "1"})
+
+        route_decorator('GET', '/search')(handler)
+        assert self.registered['handler']() == ({"detail": detail}, 400, {"X-Error": "1"})
+
+    def test_unexpected_exception_is_500(self):
+        """Test an unexpected error becomes a JSON 500 body."""
+        from fasterapi.fastapi_compat import route_decorator
+
+        def handler():
+            raise RuntimeError("boom")
+
+        route_decorator('GET', '/boom')(handler)
+        body, status = self.registered['handler']()
+        assert status == 500
+        assert body == {"detail": "Internal server error: boom"}
+
+
 # =============================================================================
 # FastAPI Alias Test
 # =============================================================================
@@ -903,6 +1069,22 @@ class TestFastAPIAlias:
 class TestEdgeCases:
     """Edge case tests for FastAPI shim."""
 
+    def test_pydantic_aliases_still_importable(self):
+        """Test the lazily resolved Pydantic names keep their old meaning."""
+        from fasterapi.fastapi_compat import (
+            HAS_PYDANTIC as compat_has_pydantic,
+            BaseModel as CompatBaseModel,
+            PydanticValidationError,
+        )
+        assert compat_has_pydantic is HAS_PYDANTIC
+        if HAS_PYDANTIC:
+            from pydantic import ValidationError
+            assert CompatBaseModel is BaseModel
+            assert PydanticValidationError is ValidationError
+        else:
+            assert CompatBaseModel is object
+            assert PydanticValidationError is Exception
+
     def test_empty_path_pattern(self):
         """Test with empty path parameter."""
         def handler():
@@ -1174,11 +1356,7 @@ class TestRandomizedStress:
             path = '/' + '/'.join(segments)
 
             # Create function with matching params
-            params_str = ', '.join(f'{p}: str' for p in param_names)
-            func_code = f"def handler({params_str}): pass"
-            local_ns = {}
-            exec(func_code, {}, local_ns)
-            handler = local_ns['handler']
+            handler = make_handler(param_names, str)
 
             # Extract and verify
             extracted = extract_function_parameters(handler, path, 'GET')
@@ -2,23 +2,35 @@
 """
 E2E Tests for Fixed Python FasterAPI Server
 
-Tests the complete Python → C++ → ZMQ → Python flow with the fixed
-run_cpp_fastapi_server.py example.
+Tests the run_cpp_fastapi_server.py example app. By default the app is
+imported and driven in-process through TestClient (no server, no sockets).
+Pass --e2e to test the complete Python → C++ → ZMQ → Python flow against
+a real server subprocess instead.
 """
 
+import importlib.util
 import subprocess
 import time
 import sys
 import os
-import json
-import requests
 import signal
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Test configuration
 SERVER_PORT = 8000
 SERVER_HOST = "127.0.0.1"
 BASE_URL = f"http://{SERVER_HOST}:{SERVER_PORT}"
-STARTUP_WAIT = 5  # seconds to wait for server startup
+STARTUP_WAIT = 5  # max seconds to wait for server startup
+SERVER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "examples",
+    "run_cpp_fastapi_server.py",
+)
 
 # Color codes for terminal output
 GREEN = "\033[92m"
@@ -31,15 +43,38 @@ RESET = "\033[0m"
 class TestRunner:
     """Test runner with server lifecycle management"""
 
-    def __init__(self):
+    __slots__ = (
+        "e2e",
+        "server_process",
+        "client",
+        "tests_passed",
+        "tests_failed",
+        "test_results",
+    )
+
+    def __init__(self, e2e=False):
+        self.e2e = e2e
         self.server_process = None
+        self.client = None  # TestClient, or an httpx.Client with --e2e
         self.tests_passed = 0
         self.tests_failed = 0
         self.test_results = []
 
     def start_server(self):
-        """Start the FasterAPI server in a subprocess"""
+        """Start the FasterAPI server (in-process, or a subprocess with --e2e)"""
+        if not self.e2e:
+            return self.start_in_process()
+
         print(f"{BLUE}Starting FasterAPI server...{RESET}")
+        import httpx  # Only the subprocess mode talks over the network
+
+        # One pooled keep-alive client for every request in the run; HTTP/2
+        # (which needs the optional h2 package) multiplexes them when offered
+        self.client = httpx.Client(
+            base_url=BASE_URL,
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=3.0,
+        )
 
         # Set environment variables
         env = os.environ.copy()
@@ -48,34 +83,63 @@ class TestRunner:
         env["FASTERAPI_LOG_LEVEL"] = "ERROR"  # Suppress logs during tests
 
         # Start server
-        server_script = "examples/run_cpp_fastapi_server.py"
         self.server_process = subprocess.Popen(
-            ["python3.13", server_script],
+            ["python3.13", SERVER_SCRIPT],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             env=env,
             preexec_fn=os.setsid  # Create new process group for clean shutdown
         )
 
-        # Wait for server to start
-        print(f"{BLUE}Waiting {STARTUP_WAIT}s for server startup...{RESET}")
-        time.sleep(STARTUP_WAIT)
+        # Poll /health with backoff until the server answers
+        print(f"{BLUE}Waiting up to {STARTUP_WAIT}s for server startup...{RESET}")
+        deadline = time.monotonic() + STARTUP_WAIT
+        delay = 0.05
+        error = None
+        while time.monotonic() < deadline:
+            if self.server_process.poll() is not None:
+                error = f"server exited with code {self.server_process.returncode}"
+                break
+            try:
+                response = self.client.get("/health", timeout=0.5)
+                if response.status_code == 200:
+                    print(f"{GREEN}✓ Server started successfully{RESET}")
+                    return True
+            except httpx.TransportError as e:
+                error = e
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        print(f"{RED}✗ Failed to connect to server: {error}{RESET}")
+        self.stop_server()
+        return False
+
+    def start_in_process(self):
+        """Import the example app and wrap it in a TestClient"""
+        print(f"{BLUE}Loading example app in-process...{RESET}")
+        spec = importlib.util.spec_from_file_location("run_cpp_fastapi_server", SERVER_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)  # Also puts the repo root on sys.path
+
+        from fasterapi.testclient import TestClient
+
+        self.client = TestClient(module.app)
+        print(f"{GREEN}✓ App loaded{RESET}")
+        return True
 
-        # Verify server is running
-        try:
-            response = requests.get(f"{BASE_URL}/health", timeout=3)
-            if response.status_code == 200:
-                print(f"{GREEN}✓ Server started successfully{RESET}")
-                return True
-        except Exception as e:
-            print(f"{RED}✗ Failed to connect to server: {e}{RESET}")
-            self.stop_server()
-            return False
+    def get(self, path):
+        """GET a path from the app under test"""
+        return self.client.get(path)
 
-        return True
+    def post(self, path, payload):
+        """POST a JSON payload to the app under test"""
+        return self.client.post(path, json=payload)
 
     def stop_server(self):
         """Stop the FasterAPI server"""
+        if self.e2e and self.client:
+            self.client.close()
+            self.client = None
         if self.server_process:
             print(f"{BLUE}Stopping server...{RESET}")
             try:
@@ -89,67 +153,55 @@ class TestRunner:
                 print(f"{YELLOW}Warning: Error stopping server: {e}{RESET}")
             print(f"{BLUE}Server stopped{RESET}")
 
-    def test_get(self, path, expected_key, expected_value=None, desc=""):
-        """Test GET request"""
+    def check_get(self, path, expected_key, expected_value=None):
+        """GET a path; return an error message, or None on success"""
+        response = self.get(path)
+        if response.status_code != 200:
+            return f"HTTP {response.status_code}"
+
+        data = json_loads(response.content)
+        if expected_key not in data:
+            return f"Key '{expected_key}' not in response"
+        if expected_value is not None and data[expected_key] != expected_value:
+            return f"Expected {expected_value}, got {data[expected_key]}"
+        return None
+
+    def check_post(self, path, payload, expected_key):
+        """POST a payload; return an error message, or None on success"""
+        response = self.post(path, payload)
+        if response.status_code not in [200, 201]:
+            return f"HTTP {response.status_code}"
+        if expected_key not in json_loads(response.content):
+            return f"Key '{expected_key}' not in response"
+        return None
+
+    def check_list_nonempty(self, path):
+        """GET a list endpoint; return an error message, or None on success"""
+        response = self.get(path)
+        if response.status_code != 200:
+            return f"HTTP {response.status_code}"
+        items = json_loads(response.content)
+        if not isinstance(items, list) or not items:
+            return "Expected a non-empty list"
+        return None
+
+    def check_list_length(self, path, expected_length):
+        """GET a list endpoint; return an error message, or None on success"""
+        response = self.get(path)
+        if response.status_code != 200:
+            return f"HTTP {response.status_code}"
+        items = json_loads(response.content)
+        if not isinstance(items, list) or len(items) != expected_length:
+            return f"Expected {expected_length} items"
+        return None
+
+    def run_check(self, check):
+        """Run one (desc, func, args) check, turning exceptions into failures"""
+        _, func, args = check
         try:
-            response = requests.get(f"{BASE_URL}{path}", timeout=3)
-
-            if response.status_code != 200:
-                self.tests_failed += 1
-                print(f"  {RED}✗{RESET} {desc}: HTTP {response.status_code}")
-                return False
-
-            data = response.json()
-
-            if expected_key not in data:
-                self.tests_failed += 1
-                print(f"  {RED}✗{RESET} {desc}: Key '{expected_key}' not in response")
-                return False
-
-            if expected_value is not None and data[expected_key] != expected_value:
-                self.tests_failed += 1
-                print(f"  {RED}✗{RESET} {desc}: Expected {expected_value}, got {data[expected_key]}")
-                return False
-
-            self.tests_passed += 1
-            print(f"  {GREEN}✓{RESET} {desc}")
-            return True
-
+            return func(*args)
         except Exception as e:
-            self.tests_failed += 1
-            print(f"  {RED}✗{RESET} {desc}: {e}")
-            return False
-
-    def test_post(self, path, payload, expected_key, desc=""):
-        """Test POST request"""
-        try:
-            response = requests.post(
-                f"{BASE_URL}{path}",
-                json=payload,
-                timeout=3,
-                headers={"Content-Type": "application/json"}
-            )
-
-            if response.status_code not in [200, 201]:
-                self.tests_failed += 1
-                print(f"  {RED}✗{RESET} {desc}: HTTP {response.status_code}")
-                return False
-
-            data = response.json()
-
-            if expected_key not in data:
-                self.tests_failed += 1
-                print(f"  {RED}✗{RESET} {desc}: Key '{expected_key}' not in response")
-                return False
-
-            self.tests_passed += 1
-            print(f"  {GREEN}✓{RESET} {desc}")
-            return True
-
-        except Exception as e:
-            self.tests_failed += 1
-            print(f"  {RED}✗{RESET} {desc}: {e}")
-            return False
+            return str(e)
 
     def run_tests(self):
         """Run all tests"""
@@ -157,58 +209,68 @@ class TestRunner:
         print(f"{BLUE}Running FasterAPI Python Server E2E Tests{RESET}")
         print(f"{BLUE}{'='*70}{RESET}\n")
 
-        # Test 1: Root endpoint
-        print(f"{BLUE}Test Suite 1: Basic Endpoints{RESET}")
-        self.test_get("/", "message", "Welcome to FasterAPI!", "GET / (root)")
-        self.test_get("/health", "status", "healthy", "GET /health")
-
-        # Test 2: Items API
-        print(f"\n{BLUE}Test Suite 2: Items API{RESET}")
-        self.test_get("/items", "0", desc="GET /items (list)")
-        self.test_get("/items/1", "name", "Widget", "GET /items/1")
-        self.test_get("/items/2", "name", "Gadget", "GET /items/2")
-        self.test_get("/items/3", "name", "Doohickey", "GET /items/3")
-
-        # Test 3: Query parameters
-        print(f"\n{BLUE}Test Suite 3: Query Parameters{RESET}")
-        try:
-            # Test with query params
-            response = requests.get(f"{BASE_URL}/items?skip=0&limit=2", timeout=3)
-            if response.status_code == 200:
-                items = response.json()
-                if isinstance(items, list) and len(items) == 2:
-                    self.tests_passed += 1
-                    print(f"  {GREEN}✓{RESET} GET /items?skip=0&limit=2")
-                else:
-                    self.tests_failed += 1
-                    print(f"  {RED}✗{RESET} GET /items?skip=0&limit=2: Expected 2 items")
-            else:
-                self.tests_failed += 1
-                print(f"  {RED}✗{RESET} GET /items?skip=0&limit=2: HTTP {response.status_code}")
-        except Exception as e:
-            self.tests_failed += 1
-            print(f"  {RED}✗{RESET} GET /items?skip=0&limit=2: {e}")
-
-        # Test 4: Users API
-        print(f"\n{BLUE}Test Suite 4: Users API{RESET}")
-        self.test_get("/users", "0", desc="GET /users (list)")
-        self.test_get("/users/1", "username", "alice", "GET /users/1")
-        self.test_get("/users/2", "username", "bob", "GET /users/2")
-        self.test_get("/users/3", "username", "charlie", "GET /users/3")
-
-        # Test 5: POST requests
-        print(f"\n{BLUE}Test Suite 5: POST Requests{RESET}")
         new_item = {
             "name": "TestItem",
             "description": "A test item",
             "price": 99.99,
             "tax": 9.99
         }
-        self.test_post("/items", new_item, "id", "POST /items (create)")
-
-        # Test 6: OpenAPI
-        print(f"\n{BLUE}Test Suite 6: OpenAPI{RESET}")
-        self.test_get("/openapi.json", "openapi", desc="GET /openapi.json")
+        suites = [
+            ("Basic Endpoints", [
+                ("GET / (root)", self.check_get, ("/", "message", "Welcome to FasterAPI!")),
+                ("GET /health", self.check_get, ("/health", "status", "healthy")),
+            ]),
+            ("Items API", [
+                ("GET /items (list)", self.check_list_nonempty, ("/items",)),
+                ("GET /items/1", self.check_get, ("/items/1", "name", "Widget")),
+                ("GET /items/2", self.check_get, ("/items/2", "name", "Gadget")),
+                ("GET /items/3", self.check_get, ("/items/3", "name", "Doohickey")),
+            ]),
+            ("Query Parameters", [
+                ("GET /items?skip=0&limit=2", self.check_list_length, ("/items?skip=0&limit=2", 2)),
+            ]),
+            ("Users API", [
+                ("GET /users (list)", self.check_list_nonempty, ("/users",)),
+                ("GET /users/1", self.check_get, ("/users/1", "username", "alice")),
+                ("GET /users/2", self.check_get, ("/users/2", "username", "bob")),
+                ("GET /users/3", self.check_get, ("/users/3", "username", "charlie")),
+            ]),
+            ("POST Requests", [
+                ("POST /items (create)", self.check_post, ("/items", new_item, "id")),
+            ]),
+        ]
+        # The ASGI fallback used without the native module does not serve
+        # /openapi.json, so that check only runs where the schema exists
+        serves_openapi = self.e2e
+        if not serves_openapi:
+            from fasterapi.fastapi_compat import HAS_NATIVE
+            serves_openapi = HAS_NATIVE
+
+        if serves_openapi:
+            suites.append(("OpenAPI", [
+                ("GET /openapi.json", self.check_get, ("/openapi.json", "openapi")),
+            ]))
+        else:
+            print(f"{YELLOW}Skipping OpenAPI checks: native module not available{RESET}\n")
+
+        # The checks are independent, so issue them concurrently and
+        # report in declaration order once they have all finished
+        checks = [check for _, suite in suites for check in suite]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            errors = iter(list(pool.map(self.run_check, checks)))
+
+        for number, (name, suite) in enumerate(suites, 1):
+            if number > 1:
+                print()
+            print(f"{BLUE}Test Suite {number}: {name}{RESET}")
+            for desc, _, _ in suite:
+                error = next(errors)
+                if error is None:
+                    self.tests_passed += 1
+                    print(f"  {GREEN}✓{RESET} {desc}")
+                else:
+                    self.tests_failed += 1
+                    print(f"  {RED}✗{RESET} {desc}: {error}")
 
         # Print summary
         print(f"\n{BLUE}{'='*70}{RESET}")
@@ -224,7 +286,7 @@ class TestRunner:
 
 def main():
     """Main test entry point"""
-    runner = TestRunner()
+    runner = TestRunner(e2e="--e2e" in sys.argv[1:])
 
     try:
         # Start server
@@ -9,7 +9,8 @@ import asyncio
 from fasterapi.core import Future, when_all, when_any, Reactor
 from fasterapi.core.combinators import (
     map_async, filter_async, reduce_async,
-    retry_async, timeout_async, Pipeline, when_some
+    retry_async, timeout_async, Pipeline, when_some,
+    when_any as when_any_rest,
 )
 
 
@@ -79,6 +80,15 @@ class TestChaining:
         result = f.then(lambda x: x * 2)
         assert result.failed()
 
+    def test_long_chain_keeps_original_error(self):
+        """A failure propagates unchanged through every later stage."""
+        f = Future.make_exception(ValueError("original"))
+        for _ in range(100):
+            f = f.then(lambda x: x + 1)
+        assert f.failed()
+        with pytest.raises(ValueError, match="original"):
+            f.get()
+
 
 class TestParallelExecution:
     """Test parallel execution patterns."""
@@ -90,6 +100,27 @@ class TestParallelExecution:
         results = await when_all(futures)
         assert results == [0, 1, 4, 9, 16]
     
+    @pytest.mark.asyncio
+    async def test_when_all_mixed_ready_and_pending(self):
+        """Ready futures and pending awaitables keep their positions."""
+        async def delayed(value):
+            await asyncio.sleep(0)
+            return value
+
+        inputs = [Future.make_ready(i) if i % 2 else delayed(i) for i in range(10)]
+        results = await when_all(inputs)
+        assert results == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_when_all_typed_results(self):
+        """typecode collects numeric results into an array.array."""
+        import array
+
+        futures = [Future.make_ready(i * i) for i in range(1, 101)]
+        results = await when_all(futures, typecode='q')
+        assert isinstance(results, array.array)
+        assert results.tolist() == [i * i for i in range(1, 101)]
+
     @pytest.mark.asyncio
     async def test_when_all_empty(self):
         """Test when_all with empty list."""
@@ -108,6 +139,32 @@ class TestParallelExecution:
         assert result in [1, 2, 3]
         assert len(remaining) >= 0
     
+    @pytest.mark.asyncio
+    async def test_when_any_ready_returns_pending_rest(self):
+        """Test a ready input wins and only unsettled inputs remain."""
+        loop = asyncio.get_running_loop()
+        waiting = loop.create_future()
+        futures = [waiting, Future.make_ready(2), Future.make_ready(3)]
+        result, remaining = await when_any_rest(futures)
+        assert result == 2
+        assert remaining == [waiting]
+        assert not waiting.cancelled()
+    
+    @pytest.mark.asyncio
+    async def test_when_any_ready_starts_coroutine_rest(self):
+        """Test coroutines left over by a ready winner are still run."""
+        ran = []
+        
+        async def work():
+            ran.append(True)
+            return 7
+        
+        result, remaining = await when_any_rest([Future.make_ready(1), work()])
+        assert result == 1
+        assert len(remaining) == 1
+        assert await remaining[0] == 7
+        assert ran == [True]
+    
     @pytest.mark.asyncio
     async def test_when_some(self):
         """Test when_some combinator."""
@@ -157,6 +214,18 @@ class TestErrorHandling:
         result = f.handle_error(lambda e: 0)
         assert result.get() == 42
     
+    def test_handle_error_reraise(self):
+        """Test a handler that re-raises keeps the original failure."""
+        f = Future.make_exception(ValueError("error"))
+        
+        def reraise(e):
+            raise e
+        
+        result = f.handle_error(reraise)
+        assert result is f
+        with pytest.raises(ValueError):
+            result.get()
+    
     @pytest.mark.asyncio
     async def test_retry_success_first_try(self):
         """Test retry that succeeds on first try."""
@@ -242,6 +311,20 @@ class TestPipeline:
         result = await pipeline.execute(initial=5)
         assert result == 20
 
+    @pytest.mark.asyncio
+    async def test_pipeline_stage_replaced_in_place(self):
+        """Test replacing a stage with an async one after a sync run."""
+        pipeline = Pipeline().add(lambda: 1).add(lambda x: x + 1)
+        assert await pipeline.execute() == 2
+
+        async def double(x):
+            return x * 2
+
+        pipeline.stages[1] = double
+        assert await pipeline.execute() == 2
+        pipeline.stages[0] = lambda: 5
+        assert await pipeline.execute() == 10
+
 
 class TestReactor:
     """Test reactor functionality."""
@@ -299,6 +382,28 @@ class TestComplexScenarios:
         assert results[0] == [0, 1, 2]
         assert results[1] == [0, 10, 20]
     
+    @pytest.mark.asyncio
+    async def test_when_all_coroutine_inputs(self):
+        """Test when_all awaits coroutine inputs without Task wrappers."""
+        group1 = [Future.make_ready(i) for i in range(3)]
+        group2 = [Future.make_ready(i * 10) for i in range(3)]
+        
+        results = await when_all([when_all(group1), when_all(group2)])
+        
+        assert results == [[0, 1, 2], [0, 10, 20]]
+    
+    @pytest.mark.asyncio
+    async def test_when_all_single_pending_inline(self):
+        """Test a lone pending input among ready ones is awaited inline."""
+        async def work():
+            await asyncio.sleep(0)
+            return 'late'
+        
+        futures = [Future.make_ready(1), work(), Future.make_ready(3)]
+        results = await when_all(futures)
+        
+        assert results == [1, 'late', 3]
+    
     @pytest.mark.asyncio
     async def test_chain_then_parallel(self):
         """Test chaining followed by parallel execution."""
@@ -18,7 +18,7 @@ Tests cover:
 - Redirect handling
 """
 
-import sys
+import asyncio
 import json
 import random
 import string
@@ -27,8 +27,6 @@ import os
 
 import pytest
 
-sys.path.insert(0, '/Users/bengamble/FasterAPI')
-
 from fasterapi.http.request import Request, Method
 from fasterapi.http.response import Response, Status
 
@@ -188,6 +186,45 @@ class TestRequestCreation:
             req = Request(protocol=protocol)
             assert req.get_protocol() == protocol
 
+    def test_from_raw(self):
+        """Test building a request from raw HTTP/1.1 bytes."""
+        raw = (
+            b'POST /api/users?page=2&q= HTTP/1.1\r\n'
+            b'Host: example.com\r\n'
+            b'Content-Type:application/json\r\n'
+            b'X-Token:  abc:def \r\n'
+            b'\r\n'
+            b'{"a": 1}'
+        )
+        req = Request.from_raw(raw)
+        assert req.method == Method.POST
+        assert req.path == '/api/users'
+        assert req.query_params == {'page': '2', 'q': ''}
+        assert req.get_header('host') == 'example.com'
+        assert req.get_header('content-type') == 'application/json'
+        assert req.get_header('x-token') == 'abc:def'
+        assert req.json_sync() == {'a': 1}
+
+    def test_from_raw_duplicate_header_keeps_first(self):
+        """Test a repeated header keeps its first value, whatever the case."""
+        raw = (
+            b'POST / HTTP/1.1\r\n'
+            b'Content-Length: 3\r\n'
+            b'content-length: 10\r\n'
+            b'Host: a.example\r\n'
+            b'HOST: b.example\r\n'
+            b'\r\n'
+            b'abc'
+        )
+        req = Request.from_raw(raw)
+        assert req.get_header('content-length') == '3'
+        assert req.get_header('host') == 'a.example'
+
+    def test_from_raw_incomplete(self):
+        """Test raw input without the blank line is rejected."""
+        with pytest.raises(ValueError):
+            Request.from_raw(b'GET / HTTP/1.1\r\nHost: x\r\n')
+
 
 # =============================================================================
 # Request Getter Tests
@@ -252,18 +289,72 @@ class TestRequestHeaders:
         assert req.get_header('Content-Type') == 'application/json'
         assert req.get_header('CONTENT-TYPE') == 'application/json'
 
+    def test_mixed_case_header_names_folded(self):
+        """Test header names are lowercased when the request is built."""
+        req = Request(headers={'Content-Type': 'text/html', 'X-Request-ID': '7'})
+        assert req.headers == {'content-type': 'text/html', 'x-request-id': '7'}
+        assert req.get_header('x-request-id') == '7'
+        assert req.get_header('Content-Type') == 'text/html'
+
+    def test_header_merge_operators_fold_names(self):
+        """Test |, |= and fromkeys fold header names like item assignment."""
+        req = Request(headers={'accept': '*/*'})
+        headers = req.headers
+        headers |= {'X-A': '1'}
+        assert 'x-a' in headers
+        assert dict(headers) == {'accept': '*/*', 'x-a': '1'}
+
+        merged = headers | {'X-B': '2'}
+        assert merged['x-b'] == '2'
+        assert 'x-b' not in headers
+        assert ({'X-C': '3'} | headers)['x-c'] == '3'
+
+        fresh = type(headers).fromkeys(['X-D'], '4')
+        assert dict(fresh) == {'x-d': '4'}
+
     def test_get_header_missing(self):
         """Test getting missing header returns empty string."""
         req = Request()
         assert req.get_header('x-missing') == ''
 
     def test_get_headers(self):
-        """Test get_headers returns copy."""
+        """Test get_headers returns a read-only view."""
         headers = {'a': '1', 'b': '2'}
         req = Request(headers=headers)
         returned = req.get_headers()
         assert returned == headers
-        # Should be a copy
+        with pytest.raises(TypeError):
+            returned['c'] = '3'
+
+    def test_headerless_request_copy_is_mutable(self):
+        """Test a request without headers still yields a usable copy."""
+        req = Request()
+        assert req.headers == {}
+        copied = req.copy_headers()
+        copied['X-Extra'] = '1'
+        assert copied['x-extra'] == '1'
+        assert Request().headers == {}
+
+    def test_headerless_request_is_writable(self):
+        """Test middleware can write headers and params on an empty request."""
+        req = Request()
+        req.headers['X-Trace'] = 'abc'
+        req.query_params['page'] = '2'
+        req.path_params['id'] = '7'
+        assert req.get_header('x-trace') == 'abc'
+        assert req.get_query_param('page') == '2'
+        assert req.get_path_param('id') == '7'
+        other = Request()
+        assert other.headers == {}
+        assert other.query_params == {}
+        assert other.path_params == {}
+
+    def test_copy_headers(self):
+        """Test copy_headers returns an independent copy."""
+        headers = {'a': '1', 'b': '2'}
+        req = Request(headers=headers)
+        returned = req.copy_headers()
+        assert returned == headers
         returned['c'] = '3'
         assert 'c' not in req.headers
 
@@ -373,6 +464,13 @@ class TestRequestBodyParsing:
         req = Request(headers={'content-type': 'application/json'})
         assert req.is_multipart() is False
 
+    def test_get_media_type(self):
+        """Test media type drops parameters and case."""
+        req = Request(headers={'content-type': 'Application/JSON; charset=UTF-8'})
+        assert req.get_media_type() == 'application/json'
+        assert req.is_json() is True
+        assert req.is_multipart() is False
+
     def test_json_valid(self):
         """Test parsing valid JSON body."""
         data = {'name': random_string(), 'value': random_int(), 'active': True}
@@ -401,6 +499,27 @@ class TestRequestBodyParsing:
         with pytest.raises(ValueError, match="Invalid JSON"):
             req.json()
 
+    def test_json_sync_bytes_body(self):
+        """Test json_sync parses a bytes-only body, including null and wide ints."""
+        req = Request(body_bytes=b'{"id": 123456789012345678901234567890}')
+        assert req.json_sync() == {'id': 123456789012345678901234567890}
+
+        req = Request(body_bytes=b'[-9223372036854775809]')
+        assert req.json_sync() == [-9223372036854775809]
+
+        req = Request(body_bytes=b'null')
+        assert req.json_sync() is None
+        assert req.json_sync() is None
+
+    def test_json_sync_digits_in_strings(self):
+        """Test long digit runs inside strings and negative wide ints."""
+        body = b'{"phones": ["123456789012345678901234"], "n": [-123456789012345678901]}'
+        req = Request(body_bytes=body)
+        assert req.json_sync() == {
+            'phones': ['123456789012345678901234'],
+            'n': [-123456789012345678901],
+        }
+
     def test_form_urlencoded(self):
         """Test parsing URL-encoded form data."""
         req = Request(
@@ -412,6 +531,17 @@ class TestRequestBodyParsing:
         assert form_data['email'] == 'john@example.com'
         assert form_data['age'] == '30'
 
+    def test_form_urlencoded_matches_parse_qsl(self):
+        """Test plain and escaped form bodies parse like urllib's parse_qsl."""
+        from urllib.parse import parse_qsl
+        for body in ('a=1&b=&c&=x', 'name=J%C3%B6rg+K&tag=a%26b'):
+            req = Request(
+                headers={'content-type': 'application/x-www-form-urlencoded'},
+                body=body
+            )
+            form_data = asyncio.run(req.form())
+            assert form_data == dict(parse_qsl(body))
+
     def test_form_empty(self):
         """Test parsing empty form data."""
         req = Request(body='')
@@ -476,6 +606,71 @@ class TestResponseStatus:
         resp.status(404)
         assert resp.status_code == Status.NOT_FOUND
 
+    def test_set_status_by_name(self):
+        """Test setting status from a member name."""
+        resp = Response()
+        assert resp.set_status_by_name('NOT_FOUND') is resp
+        assert resp.status_code == Status.NOT_FOUND
+        with pytest.raises(KeyError):
+            resp.set_status_by_name('TEAPOT')
+
+    def test_status_line(self):
+        """Test the serialized HTTP/1.1 status line."""
+        resp = Response()
+        assert resp.status_line() == b'HTTP/1.1 200 OK\r\n'
+        resp.status(404)
+        assert resp.status_line() == b'HTTP/1.1 404 Not Found\r\n'
+
+    def test_render_head(self):
+        """Test the serialized head has one line per header and cookie."""
+        resp = Response().status(201).text('ok')
+        resp.cookie('a', '1').cookie('b', '2')
+        assert resp.render_head() == (
+            b'HTTP/1.1 201 Created\r\n'
+            b'content-type: text/plain\r\n'
+            b'set-cookie: a=1\r\n'
+            b'set-cookie: b=2\r\n'
+            b'\r\n'
+        )
+
+    def test_render_head_title_case(self):
+        """Test header names can be written in canonical case."""
+        resp = Response().header('x-trace-id', '7').header('etag', '"1"')
+        resp.cookie('a', '1')
+        assert resp.render_head(title_case=True) == (
+            b'HTTP/1.1 200 OK\r\n'
+            b'X-Trace-Id: 7\r\n'
+            b'ETag: "1"\r\n'
+            b'Set-Cookie: a=1\r\n'
+            b'\r\n'
+        )
+
+    def test_render_head_title_case_digits_and_acronyms(self):
+        """Test canonical case for names with digits or acronyms."""
+        resp = Response().header('x-2fa', 'on').header('content-md5', 'abc')
+        head = bytes(resp.render_head(title_case=True))
+        assert b'X-2fa: on\r\n' in head
+        assert b'Content-MD5: abc\r\n' in head
+
+    def test_render_head_non_str_value(self):
+        """Test non-string header values are written with str()."""
+        resp = Response().header('content-length', 12)
+        assert b'content-length: 12\r\n' in bytes(resp.render_head())
+
+    def test_render_head_rejects_crlf(self):
+        """Test values that would inject a header line are rejected."""
+        resp = Response().header('x-a', 'v\r\nSet-Cookie: evil=1')
+        with pytest.raises(ValueError):
+            resp.render_head()
+
+        resp = Response().redirect('/next\nSet-Cookie: evil=1')
+        with pytest.raises(ValueError):
+            resp.render_head()
+
+        resp = Response().cookie('a', '1\r\nX-Evil: 1')
+        with pytest.raises(ValueError):
+            resp.render_head()
+
 
 # =============================================================================
 # Response Header Tests
@@ -512,6 +707,16 @@ class TestResponseHeaders:
         assert resp.headers['x-header-1'] == 'value1'
         assert resp.headers['x-header-2'] == 'value2'
 
+    def test_headers_lookup_any_case(self):
+        """Test headers mapping matches names regardless of case."""
+        resp = Response()
+        resp.header('X-Trace', 'abc')
+        assert resp.headers['X-TRACE'] == 'abc'
+        assert 'x-Trace' in resp.headers
+        assert resp.headers.get('X-Missing') is None
+        resp.headers['ETag'] = '"1"'
+        assert resp.headers == {'x-trace': 'abc', 'etag': '"1"'}
+
 
 # =============================================================================
 # Response Body Tests
@@ -600,6 +805,30 @@ class TestResponseFile:
             resp = Response()
             resp.file(temp_path)
             assert resp.headers['content-type'] == 'application/octet-stream'
+            assert resp.get_size() == len(content)
+
+            with tempfile.TemporaryFile() as out:
+                assert resp.sendfile(out.fileno()) == len(content)
+                out.seek(0)
+                assert out.read() == content
+        finally:
+            os.unlink(temp_path)
+
+    def test_file_without_os_sendfile(self, monkeypatch):
+        """Test file responses fall back to writing from an mmap."""
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            content = random_string(5000).encode()
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            monkeypatch.delattr(os, 'sendfile', raising=False)
+            resp = Response()
+            resp.file(temp_path)
+            with tempfile.TemporaryFile() as out:
+                assert resp.sendfile(out.fileno()) == len(content)
+                out.seek(0)
+                assert out.read() == content
         finally:
             os.unlink(temp_path)
 
@@ -680,6 +909,56 @@ class TestResponseCookies:
         assert 'cookie1=value1' in cookie_header
         assert 'cookie2=value2' in cookie_header
 
+    def test_set_cookies_kept_separate(self):
+        """Test each cookie stays its own Set-Cookie value."""
+        resp = Response()
+        resp.cookie('a', '1', {'expires': 'Thu, 01 Jan 1970 00:00:00 GMT'})
+        resp.cookie('b', '2')
+        assert resp.get_set_cookies() == [
+            'a=1; expires=Thu, 01 Jan 1970 00:00:00 GMT',
+            'b=2',
+        ]
+        assert 'a=1' in resp.headers['set-cookie']
+        resp.cookie('c', '3')
+        assert 'c=3' in resp.headers['set-cookie']
+        assert len(resp.get_set_cookies()) == 3
+
+    def test_headers_read_has_no_side_effects(self):
+        """Test reading headers neither writes nor changes the cookie format."""
+        resp = Response()
+        resp.cookie('a', '1')
+        resp.cookie('b', '2')
+        before = dict(resp.headers)
+        assert resp.headers['set-cookie'] == 'a=1, b=2'
+        assert dict(resp.headers) == before
+        head = bytes(resp.render_head())
+        assert b'set-cookie: a=1\r\nset-cookie: b=2\r\n' in head
+
+    def test_headers_setter_folds_case(self):
+        """Test assigning a plain dict keeps case-insensitive lookups."""
+        resp = Response()
+        resp.headers = {'Content-Type': 'text/plain'}
+        assert resp.headers['content-type'] == 'text/plain'
+        assert 'CONTENT-TYPE' in resp.headers
+
+    def test_cookie_header_overwritten_or_deleted(self):
+        """Test writes to set-cookie through headers replace earlier cookies."""
+        resp = Response()
+        resp.cookie('a', '1')
+        resp.cookie('b', '2')
+        resp.headers['set-cookie'] = 'c=3'
+        assert resp.get_set_cookies() == ['c=3']
+        head = bytes(resp.render_head())
+        assert b'set-cookie: c=3\r\n' in head
+        assert b'a=1' not in head and b'b=2' not in head
+
+        resp.cookie('d', '4')
+        assert resp.get_set_cookies() == ['c=3', 'd=4']
+
+        del resp.headers['set-cookie']
+        assert resp.get_set_cookies() == []
+        assert b'set-cookie' not in bytes(resp.render_head())
+
     def test_clear_cookie(self):
         """Test clearing a cookie."""
         resp = Response()
@@ -20,18 +20,27 @@ Tests cover:
 import sys
 import random
 import string
-from dataclasses import asdict
+from dataclasses import fields
+from functools import lru_cache
+from operator import attrgetter
 
 import pytest
 
-sys.path.insert(0, '/Users/bengamble/FasterAPI')
-
 # Import submodules directly using importlib to bypass broken __init__.py
 import importlib.util
 import types as types_module
+from pathlib import Path
+
+MCP_DIR = Path(__file__).resolve().parents[1] / 'fasterapi' / 'mcp'
+
+def import_module_directly(module_path: Path, module_name: str):
+    """Import a module directly from file path, bypassing package __init__.py.
 
-def import_module_directly(module_path: str, module_name: str):
-    """Import a module directly from file path, bypassing package __init__.py."""
+    Reuses the module if an earlier import already registered it.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
     spec = importlib.util.spec_from_file_location(module_name, module_path)
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
@@ -39,10 +48,7 @@ def import_module_directly(module_path: str, module_name: str):
     return module
 
 # Import types module directly
-mcp_types = import_module_directly(
-    '/Users/bengamble/FasterAPI/fasterapi/mcp/types.py',
-    'fasterapi.mcp.types_direct'
-)
+mcp_types = import_module_directly(MCP_DIR / 'types.py', 'fasterapi.mcp.types_direct')
 Tool = mcp_types.Tool
 Resource = mcp_types.Resource
 Prompt = mcp_types.Prompt
@@ -50,17 +56,16 @@ ToolResult = mcp_types.ToolResult
 ResourceContent = mcp_types.ResourceContent
 TransportType = mcp_types.TransportType
 
+_TRANSPORT_VALUES = tuple(t.value for t in TransportType)
+
 # Mock the missing proxy_bindings to allow proxy import
 mock_proxy_bindings = types_module.ModuleType('fasterapi.mcp.proxy_bindings')
+mock_proxy_bindings.__package__ = 'fasterapi.mcp'
 mock_proxy_bindings.ProxyBindings = None
 sys.modules['fasterapi.mcp.proxy_bindings'] = mock_proxy_bindings
-sys.modules['.proxy_bindings'] = mock_proxy_bindings
 
 # Import proxy module directly
-mcp_proxy = import_module_directly(
-    '/Users/bengamble/FasterAPI/fasterapi/mcp/proxy.py',
-    'fasterapi.mcp.proxy_direct'
-)
+mcp_proxy = import_module_directly(MCP_DIR / 'proxy.py', 'fasterapi.mcp.proxy_direct')
 UpstreamConfig = mcp_proxy.UpstreamConfig
 ProxyRoute = mcp_proxy.ProxyRoute
 ProxyStats = mcp_proxy.ProxyStats
@@ -70,23 +75,75 @@ ProxyStats = mcp_proxy.ProxyStats
 # Test Helpers
 # =============================================================================
 
-def random_string(length: int = 10) -> str:
+_ALPHANUM = string.ascii_letters + string.digits
+
+
+def random_string(length: int = 10, rng: random.Random = random) -> str:
     """Generate a random string."""
-    first = random.choice(string.ascii_letters)
+    first = rng.choice(string.ascii_letters)
     if length == 1:
         return first
-    rest = ''.join(random.choices(string.ascii_letters + string.digits, k=length - 1))
+    rest = ''.join(rng.choices(_ALPHANUM, k=length - 1))
     return first + rest
 
 
-def random_int(min_val: int = 1, max_val: int = 1000) -> int:
+def random_int(min_val: int = 1, max_val: int = 1000, rng: random.Random = random) -> int:
     """Generate a random integer."""
-    return random.randint(min_val, max_val)
+    return rng.randint(min_val, max_val)
 
 
-def random_uri() -> str:
+def random_uri(rng: random.Random = random) -> str:
     """Generate a random URI."""
-    return f"resource://{random_string(8)}/{random_string(5)}"
+    return f"resource://{random_string(8, rng)}/{random_string(5, rng)}"
+
+
+@lru_cache(maxsize=None)
+def _field_names(dc) -> frozenset:
+    """Field names of a dataclass, without building an asdict() copy."""
+    return frozenset(f.name for f in fields(dc))
+
+
+# Randomized cases are drawn once from a fixed seed, so every run checks
+# the same inputs and each shows up as its own test id
+_RNG = random.Random(0xFA57E8)
+NUM_CASES = 16
+
+
+def _prompt_case():
+    args = [random_string(8, _RNG) for _ in range(random_int(1, 5, _RNG))]
+    return random_string(10, _RNG), random_string(30, _RNG), args
+
+
+def _proxy_stats_case():
+    total = random_int(1000, 10000, _RNG)
+    success = random_int(0, total, _RNG)
+    return total, success, random_int(10000, 100000, _RNG)
+
+
+TOOL_CASES = [(random_string(15, _RNG), random_string(50, _RNG)) for _ in range(NUM_CASES)]
+RESOURCE_CASES = [(random_uri(_RNG), random_string(12, _RNG)) for _ in range(NUM_CASES)]
+PROMPT_CASES = [_prompt_case() for _ in range(NUM_CASES)]
+RESOURCE_CONTENT_CASES = [
+    (random_uri(_RNG), f"application/{random_string(5, _RNG)}", random_string(100, _RNG))
+    for _ in range(NUM_CASES)
+]
+PROXY_STATS_CASES = [_proxy_stats_case() for _ in range(NUM_CASES)]
+
+TOOL_COLLECTION = (
+    Tool(name="add", description="Add numbers"),
+    Tool(name="subtract", description="Subtract numbers"),
+    Tool(name="multiply", description="Multiply numbers"),
+    Tool(name="divide", description="Divide numbers"),
+)
+
+# (total, success, latency, expected success_rate, expected avg_latency_ms)
+PROXY_STATS_COMPUTED_CASES = [
+    (0, 0, 0, 0.0, 0.0),
+    (100, 95, 0, 0.95, 0.0),
+    (1000, 1000, 0, 1.0, 0.0),
+    (100, 0, 0, 0.0, 0.0),
+    (100, 100, 5000, 1.0, 50.0),
+]
 
 
 # =============================================================================
@@ -118,15 +175,16 @@ class TestTool:
 
     def test_tool_asdict(self):
         """Test tool conversion to dict."""
+        from dataclasses import asdict
+
         tool = Tool(name="test", description="Test tool")
         d = asdict(tool)
         assert d['name'] == "test"
         assert d['description'] == "Test tool"
 
-    def test_tool_randomized(self):
+    @pytest.mark.parametrize("name,desc", TOOL_CASES)
+    def test_tool_randomized(self, name, desc):
         """Test tool with randomized data."""
-        name = random_string(15)
-        desc = random_string(50)
         tool = Tool(name=name, description=desc)
         assert tool.name == name
         assert tool.description == desc
@@ -158,17 +216,16 @@ class TestResource:
         assert resource.description == "Application data"
         assert resource.mime_type == "application/json"
 
-    def test_resource_asdict(self):
-        """Test resource conversion to dict."""
+    def test_resource_fields(self):
+        """Test resource exposes its fields."""
         resource = Resource(uri="file:///test", name="Test")
-        d = asdict(resource)
-        assert 'uri' in d
-        assert 'name' in d
+        assert {'uri', 'name'} <= _field_names(Resource)
+        assert resource.uri == "file:///test"
+        assert resource.name == "Test"
 
-    def test_resource_randomized(self):
+    @pytest.mark.parametrize("uri,name", RESOURCE_CASES)
+    def test_resource_randomized(self, uri, name):
         """Test resource with randomized data."""
-        uri = random_uri()
-        name = random_string(12)
         resource = Resource(uri=uri, name=name)
         assert resource.uri == uri
         assert resource.name == name
@@ -200,19 +257,18 @@ class TestPrompt:
 
     def test_prompt_asdict(self):
         """Test prompt conversion to dict."""
+        from dataclasses import asdict
+
         prompt = Prompt(name="test", description="Test prompt")
         d = asdict(prompt)
         assert d['name'] == "test"
 
-    def test_prompt_randomized(self):
+    @pytest.mark.parametrize("name,desc,args", PROMPT_CASES)
+    def test_prompt_randomized(self, name, desc, args):
         """Test prompt with randomized data."""
-        name = random_string(10)
-        desc = random_string(30)
-        num_args = random_int(1, 5)
-        args = [random_string(8) for _ in range(num_args)]
         prompt = Prompt(name=name, description=desc, arguments=args)
         assert prompt.name == name
-        assert len(prompt.arguments) == num_args
+        assert len(prompt.arguments) == len(args)
 
 
 # =============================================================================
@@ -241,6 +297,8 @@ class TestToolResult:
 
     def test_tool_result_asdict(self):
         """Test tool result conversion to dict."""
+        from dataclasses import asdict
+
         result = ToolResult(is_error=False, content="success")
         d = asdict(result)
         assert d['is_error'] is False
@@ -274,11 +332,9 @@ class TestResourceContent:
         )
         assert content.mime_type == "application/json"
 
-    def test_resource_content_randomized(self):
+    @pytest.mark.parametrize("uri,mime,text", RESOURCE_CONTENT_CASES)
+    def test_resource_content_randomized(self, uri, mime, text):
         """Test resource content with randomized data."""
-        uri = random_uri()
-        mime = f"application/{random_string(5)}"
-        text = random_string(100)
         content = ResourceContent(uri=uri, mime_type=mime, content=text)
         assert content.uri == uri
         assert content.content == text
@@ -305,8 +361,7 @@ class TestTransportType:
 
     def test_all_types_unique(self):
         """Test all transport types have unique values."""
-        values = [t.value for t in TransportType]
-        assert len(values) == len(set(values))
+        assert len(_TRANSPORT_VALUES) == len(frozenset(_TRANSPORT_VALUES))
 
 
 # =============================================================================
@@ -363,12 +418,11 @@ class TestUpstreamConfig:
         assert config.request_timeout_ms == 60000
         assert config.max_retries == 5
 
-    def test_upstream_asdict(self):
-        """Test upstream conversion to dict."""
+    def test_upstream_fields(self):
+        """Test upstream exposes its fields."""
         config = UpstreamConfig(name="test", transport_type="stdio")
-        d = asdict(config)
-        assert d['name'] == "test"
-        assert 'max_connections' in d
+        assert {'name', 'max_connections'} <= _field_names(UpstreamConfig)
+        assert config.name == "test"
 
 
 # =============================================================================
@@ -442,47 +496,16 @@ class TestProxyStats:
         assert stats.successful_requests == 950
         assert stats.failed_requests == 50
 
-    def test_avg_latency_calculation(self):
-        """Test average latency calculation."""
-        stats = ProxyStats(
-            total_requests=100,
-            total_latency_ms=5000
-        )
-        assert stats.avg_latency_ms == 50.0
-
-    def test_avg_latency_zero_requests(self):
-        """Test average latency with zero requests."""
-        stats = ProxyStats()
-        assert stats.avg_latency_ms == 0.0
-
-    def test_success_rate_calculation(self):
-        """Test success rate calculation."""
-        stats = ProxyStats(
-            total_requests=100,
-            successful_requests=95
-        )
-        assert stats.success_rate == 0.95
-
-    def test_success_rate_zero_requests(self):
-        """Test success rate with zero requests."""
-        stats = ProxyStats()
-        assert stats.success_rate == 0.0
-
-    def test_success_rate_perfect(self):
-        """Test perfect success rate."""
-        stats = ProxyStats(
-            total_requests=1000,
-            successful_requests=1000
-        )
-        assert stats.success_rate == 1.0
-
-    def test_success_rate_zero_success(self):
-        """Test zero success rate."""
+    @pytest.mark.parametrize("total,success,latency,exp_rate,exp_avg", PROXY_STATS_COMPUTED_CASES)
+    def test_proxy_stats_computed(self, total, success, latency, exp_rate, exp_avg):
+        """Test success rate and average latency, including zero requests."""
         stats = ProxyStats(
-            total_requests=100,
-            successful_requests=0
+            total_requests=total,
+            successful_requests=success,
+            total_latency_ms=latency
         )
-        assert stats.success_rate == 0.0
+        assert stats.success_rate == exp_rate
+        assert stats.avg_latency_ms == exp_avg
 
     def test_proxy_stats_with_dict_fields(self):
         """Test proxy stats with dictionary fields."""
@@ -494,12 +517,10 @@ class TestProxyStats:
         assert stats.upstream_requests['server1'] == 300
         assert stats.tool_requests['calculate'] == 250
 
-    def test_proxy_stats_randomized(self):
+    @pytest.mark.parametrize("total,success,latency", PROXY_STATS_CASES)
+    def test_proxy_stats_randomized(self, total, success, latency):
         """Test proxy stats with randomized values."""
-        total = random_int(1000, 10000)
-        success = random_int(0, total)
         failed = total - success
-        latency = random_int(10000, 100000)
 
         stats = ProxyStats(
             total_requests=total,
@@ -521,26 +542,22 @@ class TestMCPTypesIntegration:
 
     def test_tool_collection(self):
         """Test creating a collection of tools."""
-        tools = [
-            Tool(name="add", description="Add numbers"),
-            Tool(name="subtract", description="Subtract numbers"),
-            Tool(name="multiply", description="Multiply numbers"),
-            Tool(name="divide", description="Divide numbers"),
-        ]
-
-        assert len(tools) == 4
-        tool_names = {t.name for t in tools}
+        assert len(TOOL_COLLECTION) == 4
+        tool_names = set(map(attrgetter('name'), TOOL_COLLECTION))
         assert tool_names == {"add", "subtract", "multiply", "divide"}
 
     def test_resource_collection(self):
         """Test creating a collection of resources."""
         resources = [
-            Resource(uri=f"file:///resource_{i}.json", name=f"Resource {i}")
+            Resource(uri="file:///resource_%d.json" % i, name="Resource %d" % i)
             for i in range(10)
         ]
 
         assert len(resources) == 10
-        assert all(r.uri.startswith("file://") for r in resources)
+        # One scan over the NUL-joined URIs; the leading separator anchors
+        # each match to the start of a URI
+        joined = "\0" + "\0".join(r.uri for r in resources)
+        assert joined.count("\0file://") == len(resources)
 
     def test_upstream_routing(self):
         """Test configuring upstreams and routes together."""
@@ -558,8 +575,8 @@ class TestMCPTypesIntegration:
 
         # Verify routing config
         assert len(upstreams) == len(routes)
-        upstream_names = {u.name for u in upstreams}
-        route_targets = {r.upstream_name for r in routes}
+        upstream_names = set(map(attrgetter('name'), upstreams))
+        route_targets = set(map(attrgetter('upstream_name'), routes))
         assert route_targets.issubset(upstream_names)
 
     def test_tool_result_from_tool(self):
@@ -7,28 +7,36 @@ query parameter parsing, and URL decoding. Tests the C++ parameter
 extractor bindings directly without requiring a running server.
 """
 
-import sys
 import random
 import string
-import pytest
+from urllib.parse import quote
 
-sys.path.insert(0, '/Users/bengamble/FasterAPI')
+import pytest
 
-# Try to import the native module
-try:
-    from fasterapi import _fastapi_native
-    NATIVE_AVAILABLE = True
-except ImportError:
-    NATIVE_AVAILABLE = False
+# Skip the whole module before any test class is built if the native
+# module is not available
+_fastapi_native = pytest.importorskip(
+    "fasterapi._fastapi_native",
+    reason="Native module not available"
+)
 
 
 # =============================================================================
 # Test Helpers
 # =============================================================================
 
+_ALPHANUM = string.ascii_letters + string.digits
+
+
 def random_string(length: int = 10) -> str:
     """Generate a random alphanumeric string."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return ''.join(random.choices(_ALPHANUM, k=length))
+
+
+def random_strings(count: int, length: int = 10) -> list:
+    """Generate several random alphanumeric strings from one draw."""
+    blob = ''.join(random.choices(_ALPHANUM, k=count * length))
+    return [blob[i:i + length] for i in range(0, count * length, length)]
 
 
 def random_int(min_val: int = 1, max_val: int = 1000) -> int:
@@ -37,110 +45,68 @@ def random_int(min_val: int = 1, max_val: int = 1000) -> int:
 
 
 def generate_url_encoded_string(s: str) -> str:
-    """Generate URL-encoded version of a string."""
-    result = []
-    for c in s:
-        if c.isalnum() or c in '-_.~':
-            result.append(c)
-        elif c == ' ':
-            result.append('%20')
-        else:
-            result.append('%{:02X}'.format(ord(c)))
-    return ''.join(result)
+    """Generate URL-encoded (UTF-8, spaces as %20) version of a string."""
+    return quote(s, safe='-_.~')
 
 
 # =============================================================================
-# Skip if native module not available
+# Path Parameter Extraction Tests - Edge Cases
 # =============================================================================
 
-pytestmark = pytest.mark.skipif(
-    not NATIVE_AVAILABLE,
-    reason="Native module not available"
-)
-
+_LONG_NAME = "a" * 100
+_MANY_PARAMS = ["param%d" % i for i in range(10)]
+
+# (id, pattern, expected parameter names)
+PATH_PARAM_CASES = [
+    ("single_at_root", "/{id}", ["id"]),
+    ("consecutive", "/items/{id1}/{id2}/{id3}", ["id1", "id2", "id3"]),
+    ("underscores", "/users/{user_account_id}", ["user_account_id"]),
+    ("numbers", "/v2/items/{item1_id}", ["item1_id"]),
+    ("empty_pattern", "", []),
+    ("root_only", "/", []),
+    ("no_parameters", "/api/v1/status", []),
+    ("long_name", "/items/{%s}" % _LONG_NAME, [_LONG_NAME]),
+    ("many_parameters", "/" + "/".join(["{%s}" % p for p in _MANY_PARAMS]), _MANY_PARAMS),
+    ("mixed_static", "/a/{b}/c/{d}/e/{f}", ["b", "d", "f"]),
+    ("at_end", "/items/details/{id}", ["id"]),
+    (
+        "deep_nesting",
+        "/api/v1/org/{org_id}/team/{team_id}/member/{member_id}/role/{role_id}",
+        ["org_id", "team_id", "member_id", "role_id"],
+    ),
+    ("single_char", "/items/{x}", ["x"]),
+]
 
-# =============================================================================
-# Path Parameter Extraction Tests - Edge Cases
-# =============================================================================
 
 class TestPathParamExtraction:
     """Edge case tests for path parameter extraction."""
 
-    def test_single_parameter_at_root(self):
-        """Test single parameter directly at root."""
-        result = _fastapi_native.extract_path_params("/{id}")
-        assert result == ["id"]
-
-    def test_consecutive_parameters(self):
-        """Test multiple consecutive parameters."""
-        result = _fastapi_native.extract_path_params("/items/{id1}/{id2}/{id3}")
-        assert result == ["id1", "id2", "id3"]
-
-    def test_parameter_with_underscores(self):
-        """Test parameter names with underscores."""
-        result = _fastapi_native.extract_path_params("/users/{user_account_id}")
-        assert result == ["user_account_id"]
-
-    def test_parameter_with_numbers(self):
-        """Test parameter names with numbers."""
-        result = _fastapi_native.extract_path_params("/v2/items/{item1_id}")
-        assert result == ["item1_id"]
-
-    def test_empty_pattern(self):
-        """Test empty pattern string."""
-        result = _fastapi_native.extract_path_params("")
-        assert result == []
-
-    def test_root_only_pattern(self):
-        """Test root path only."""
-        result = _fastapi_native.extract_path_params("/")
-        assert result == []
-
-    def test_no_parameters(self):
-        """Test pattern with no parameters."""
-        result = _fastapi_native.extract_path_params("/api/v1/status")
-        assert result == []
-
-    def test_long_parameter_name(self):
-        """Test very long parameter name."""
-        long_name = "a" * 100
-        result = _fastapi_native.extract_path_params(f"/items/{{{long_name}}}")
-        assert result == [long_name]
-
-    def test_many_parameters(self):
-        """Test pattern with many parameters."""
-        params = [f"param{i}" for i in range(10)]
-        pattern = "/" + "/".join(f"{{{p}}}" for p in params)
-        result = _fastapi_native.extract_path_params(pattern)
-        assert result == params
-
-    def test_mixed_static_and_params(self):
-        """Test alternating static segments and parameters."""
-        result = _fastapi_native.extract_path_params("/a/{b}/c/{d}/e/{f}")
-        assert result == ["b", "d", "f"]
-
-    def test_parameter_at_end(self):
-        """Test parameter at end of path."""
-        result = _fastapi_native.extract_path_params("/items/details/{id}")
-        assert result == ["id"]
-
-    def test_deep_nesting(self):
-        """Test deeply nested path."""
-        result = _fastapi_native.extract_path_params(
-            "/api/v1/org/{org_id}/team/{team_id}/member/{member_id}/role/{role_id}"
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [case[1:] for case in PATH_PARAM_CASES],
+        ids=[case[0] for case in PATH_PARAM_CASES]
+    )
+    def test_extract(self, pattern, expected):
+        """Test extraction against the fixed pattern cases."""
+        assert _fastapi_native.extract_path_params(pattern) == expected
+
+    def test_extract_batch(self):
+        """Test batch extraction matches one call per pattern."""
+        result = _fastapi_native.extract_path_params_batch(
+            [pattern for _, pattern, _ in PATH_PARAM_CASES]
         )
-        assert result == ["org_id", "team_id", "member_id", "role_id"]
+        assert result == [expected for _, _, expected in PATH_PARAM_CASES]
 
     def test_randomized_patterns(self):
         """Test with randomized patterns."""
         for _ in range(10):
             num_params = random.randint(1, 5)
-            param_names = [random_string(8) for _ in range(num_params)]
+            param_names = random_strings(num_params, 8)
             segments = []
-            for i, name in enumerate(param_names):
+            for name in param_names:
                 if random.random() > 0.5:
                     segments.append(random_string(5))
-                segments.append(f"{{{name}}}")
+                segments.append("{%s}" % name)
             pattern = "/" + "/".join(segments)
             result = _fastapi_native.extract_path_params(pattern)
             assert result == param_names
@@ -151,11 +117,6 @@ class TestPathParamExtraction:
         # Should either return empty string or be treated as literal
         assert isinstance(result, list)
 
-    def test_single_char_parameter(self):
-        """Test single character parameter name."""
-        result = _fastapi_native.extract_path_params("/items/{x}")
-        assert result == ["x"]
-
 
 # =============================================================================
 # Query Parameter Parsing Tests - Edge Cases
@@ -273,11 +234,7 @@ class TestQueryParamParsing:
         """Test with randomized query parameters."""
         for _ in range(10):
             num_params = random.randint(1, 10)
-            params = {}
-            for i in range(num_params):
-                key = random_string(5)
-                value = random_string(10)
-                params[key] = value
+            params = dict(zip(random_strings(num_params, 5), random_strings(num_params, 10)))
             query = "&".join(f"{k}={v}" for k, v in params.items())
             result = _fastapi_native.parse_query_params(f"/search?{query}")
             assert result == params